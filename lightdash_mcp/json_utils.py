@@ -0,0 +1,54 @@
+"""JSON helpers that use orjson when it is installed, falling back to stdlib json."""
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+# orjson parses integers beyond 64 bits as floats, losing precision. Any run of 19+
+# digits might be one, so such documents go through stdlib json (a false positive,
+# e.g. a long digit string, is only slower, never wrong).
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from str or bytes"""
+    if orjson is not None:
+        pattern = _LONG_DIGITS_BYTES if isinstance(data, (bytes, bytearray)) else _LONG_DIGITS
+        if not pattern.search(data):
+            return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, optionally indented by two spaces"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits, which stdlib json handles
+            pass
+    # ensure_ascii=False so output matches orjson's raw UTF-8 whichever path runs
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumpb(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, ready to send as a request body"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
@@ -1,10 +1,14 @@
 import os
 import sys
+import threading
 import time
 from typing import Any
-import json
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import json_utils
 
 LIGHTDASH_URL = os.getenv("LIGHTDASH_URL", "")
 LIGHTDASH_TOKEN = os.getenv("LIGHTDASH_TOKEN", "")
@@ -17,8 +21,25 @@ session.headers.update({
     "Authorization": f"ApiKey {LIGHTDASH_TOKEN}",
     "Content-Type": "application/json",
     "Accept": "application/json",
+    # Accept-Encoding is left to requests' default, which already includes br
+    # (and zstd) whenever the matching decoders are installed
 })
 
+# Keep-alive pool sized for concurrent tool calls (e.g. run-dashboard-tiles fan-out).
+# Retries only cover idempotent methods; POST/PATCH are never replayed.
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
 if CF_ACCESS_CLIENT_ID and CF_ACCESS_CLIENT_SECRET:
     session.headers.update({
         "CF-Access-Client-Id": CF_ACCESS_CLIENT_ID,
@@ -83,36 +104,120 @@ def _attach_iap_token() -> None:
         print(f"[IAP] Failed to sign JWT: {e}", file=sys.stderr)
 
 
-def _handle_request(method: str, path: str, **kwargs) -> dict[str, Any]:
-    """Make a request to the Lightdash API with error handling"""
+# Conditional GET support: path -> (revalidation headers, raw body) of the last 200 response,
+# kept in least-recently-used order (dicts preserve insertion order; hits are re-inserted).
+# Bounded by total body size, since a single catalog or dashboard body can be megabytes.
+_ETAG_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_etag_cache: dict[str, tuple[dict[str, str], bytes]] = {}
+_etag_cache_bytes = 0
+_etag_lock = threading.Lock()
+
+# Async query results are polled once per query UUID and never requested again,
+# so keeping their (potentially large) bodies would only hold memory
+_UNCACHED_PATH_MARKERS = ("/query/",)
+
+
+def _is_revalidatable(path: str) -> bool:
+    """Whether a GET path names a resource worth caching for conditional revalidation"""
+    return not any(marker in path for marker in _UNCACHED_PATH_MARKERS)
+
+
+def _drop_etag_entry(path: str) -> None:
+    """Remove one cached body and release its bytes from the total; caller holds _etag_lock"""
+    global _etag_cache_bytes
+    entry = _etag_cache.pop(path, None)
+    if entry is not None:
+        _etag_cache_bytes -= len(entry[1])
+
+
+def _store_etag_entry(path: str, entry: tuple[dict[str, str], bytes]) -> None:
+    """Insert a body as most recently used, evicting the oldest until under the byte cap; caller holds _etag_lock"""
+    global _etag_cache_bytes
+    _drop_etag_entry(path)
+    size = len(entry[1])
+    if size > _ETAG_CACHE_MAX_BYTES:
+        return
+    while _etag_cache and _etag_cache_bytes + size > _ETAG_CACHE_MAX_BYTES:
+        _drop_etag_entry(next(iter(_etag_cache)))
+    _etag_cache[path] = entry
+    _etag_cache_bytes += size
+
+
+def _invalidate_etags(path: str) -> None:
+    """Forget cached bodies for a resource and anything nested under it after a write"""
+    with _etag_lock:
+        for cached_path in [p for p in _etag_cache if p.startswith(path) or path.startswith(p)]:
+            _drop_etag_entry(cached_path)
+
+
+def _send(method: str, path: str, **kwargs) -> requests.Response:
+    """Send a request to the Lightdash API, raising a descriptive error on HTTP failures"""
     if IAP_ENABLED:
         _attach_iap_token()
     url = f"{LIGHTDASH_URL}{path}"
     try:
         r = session.request(method, url, **kwargs)
         r.raise_for_status()
-        return r.json()
+        return r
     except requests.exceptions.HTTPError as e:
         try:
-            error_details = r.json()
+            error_details = json_utils.loads(r.content)
         except Exception:
             error_details = r.text
 
         raise Exception(
-            f"Lightdash API Error: {e} - Details: {json.dumps(error_details) if isinstance(error_details, dict) else error_details}"
+            f"Lightdash API Error: {e} - Details: {json_utils.dumps(error_details) if isinstance(error_details, dict) else error_details}"
         ) from e
 
-def get(path: str) -> dict[str, Any]:
-    """Make a GET request to the Lightdash API"""
-    return _handle_request("GET", path)
+def _handle_request(method: str, path: str, **kwargs) -> dict[str, Any]:
+    """Make a request to the Lightdash API with error handling"""
+    r = _send(method, path, **kwargs)
+    if method != "GET":
+        _invalidate_etags(path)
+    return json_utils.loads(r.content)
 
+def get(path: str) -> dict[str, Any]:
+    """
+    Make a GET request to the Lightdash API, revalidating cached bodies with
+    If-None-Match / If-Modified-Since when the server sent ETag / Last-Modified
+    """
+    revalidatable = _is_revalidatable(path)
+    cached = None
+    if revalidatable:
+        with _etag_lock:
+            cached = _etag_cache.get(path)
+    headers = cached[0] if cached else None
+
+    r = _send("GET", path, headers=headers)
+    if r.status_code == 304 and cached:
+        with _etag_lock:
+            # Re-insert as most recently used, unless a write invalidated it meanwhile
+            if path in _etag_cache:
+                _store_etag_entry(path, cached)
+        return json_utils.loads(cached[1])
+
+    if not revalidatable:
+        return json_utils.loads(r.content)
+
+    validators = {}
+    if etag := r.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := r.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    if validators:
+        with _etag_lock:
+            _store_etag_entry(path, (validators, r.content))
+    return json_utils.loads(r.content)
+
+# Request bodies are serialized compactly: dashboard updates resend the full
+# tile list, so whitespace adds up on large dashboards
 def patch(path: str, data: dict[str, Any]) -> dict[str, Any]:
     """Make a PATCH request to the Lightdash API"""
-    return _handle_request("PATCH", path, json=data)
+    return _handle_request("PATCH", path, data=json_utils.dumpb(data))
 
 def post(path: str, data: dict[str, Any]) -> dict[str, Any]:
     """Make a POST request to the Lightdash API"""
-    return _handle_request("POST", path, json=data)
+    return _handle_request("POST", path, data=json_utils.dumpb(data))
 
 def delete(path: str) -> dict[str, Any]:
     """Make a DELETE request to the Lightdash API"""
@@ -1,42 +1,47 @@
 import asyncio
-import json
 from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+from . import json_utils
 from .tools import tool_registry
 
 app = Server("lightdash")
 
+# Tool definitions are static, so build the MCP Tool list once at import time
+_TOOL_LIST = [
+    Tool(
+        name=tool_module.TOOL_DEFINITION.name,
+        description=tool_module.TOOL_DEFINITION.description,
+        inputSchema=tool_module.TOOL_DEFINITION.input_schema.to_schema()
+    )
+    for tool_module in tool_registry.values()
+]
+
+# Dispatch straight to each tool's run function: one dict lookup per call
+_TOOL_RUNNERS = {name: tool_module.run for name, tool_module in tool_registry.items()}
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools"""
-    tool_definitions = []
-    for _tool_name, tool_module in tool_registry.items():
-        tool_def = tool_module.TOOL_DEFINITION
-        tool_definitions.append(
-            Tool(
-                name=tool_def.name,
-                description=tool_def.description,
-                inputSchema=tool_def.input_schema.dict(by_alias=True)
-            )
-        )
-    return tool_definitions
+    return _TOOL_LIST
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls"""
     try:
-        if name not in tool_registry:
+        tool_run = _TOOL_RUNNERS.get(name)
+        if tool_run is None:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
             
-        tool_module = tool_registry[name]
-        result = tool_module.run(**arguments)
+        # Tools use the blocking HTTP client; run them off the event loop so
+        # concurrent MCP requests are not serialized behind one another.
+        result = await asyncio.to_thread(tool_run, **arguments)
         
         if isinstance(result, (dict, list)):
-            result_text = json.dumps(result, indent=2)
+            result_text = json_utils.dumps(result, indent=True)
         else:
             result_text = str(result)
             
@@ -1,10 +1,13 @@
 import importlib
 import pkgutil
 
+# Shared helper modules that live alongside the tools but define no TOOL_DEFINITION
+_HELPER_MODULES = frozenset(("base_tool", "utils", "dashboard_utils", "cache_utils"))
+
 tool_registry = {}
 
 for _, module_name, _ in pkgutil.iter_modules(__path__):
-    if module_name not in ["base_tool", "utils", "dashboard_utils"]:
+    if module_name not in _HELPER_MODULES:
         module = importlib.import_module(f".{module_name}", package=__name__)
         tool_name = module.TOOL_DEFINITION.name
         tool_registry[tool_name] = module
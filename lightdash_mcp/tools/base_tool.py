@@ -1,20 +1,46 @@
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
+# Tool definitions are static, author-written data built once at import,
+# so plain slotted dataclasses are used rather than validating models.
 
-class ToolParameter(BaseModel):
+@dataclass(slots=True)
+class ToolParameter:
     type: str
     description: str
+    items: Optional[dict[str, Any]] = None
 
-class InputSchema(BaseModel):
-    type: str = "object"
+    def to_schema(self) -> dict[str, Any]:
+        schema: dict[str, Any] = {"type": self.type, "description": self.description}
+        if self.items is not None:
+            schema["items"] = self.items
+        return schema
+
+@dataclass(slots=True)
+class InputSchema:
     properties: dict[str, ToolParameter]
-    required: list[str] = Field(default_factory=list)
+    required: list[str] = field(default_factory=list)
+    type: str = "object"
 
-class ToolDefinition(BaseModel):
+    def to_schema(self) -> dict[str, Any]:
+        return {
+            "type": self.type,
+            "properties": {name: param.to_schema() for name, param in self.properties.items()},
+            "required": list(self.required),
+        }
+
+@dataclass(slots=True)
+class ToolDefinition:
     name: str
     description: str
-    input_schema: InputSchema = Field(alias="inputSchema")
+    # Named after the MCP wire field; tools pass a plain dict, converted below
+    inputSchema: InputSchema
+
+    def __post_init__(self):
+        if isinstance(self.inputSchema, dict):
+            self.inputSchema = InputSchema(**self.inputSchema)
 
-    class Config:
-        populate_by_name = True
+    @property
+    def input_schema(self) -> InputSchema:
+        return self.inputSchema
@@ -0,0 +1,110 @@
+import copy
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .. import json_utils, lightdash_client
+
+# Opt-in directory for caches that should survive server restarts
+CACHE_DIR = os.path.expanduser(os.getenv("LIGHTDASH_CACHE_DIR", ""))
+
+
+def _make_key(args: tuple, kwargs: dict[str, Any]) -> tuple:
+    return args + tuple(sorted(kwargs.items()))
+
+def ttl_cache(seconds: float = 60, copy_result: bool = True, maxsize: Optional[int] = None) -> Callable:
+    """
+    Memoize a function's results per call arguments for `seconds`.
+
+    By default every call returns a deep copy, so callers may mutate the result
+    without corrupting the cache. Pass copy_result=False for read-only values
+    such as lookup indexes. With `maxsize`, expired entries are purged and then
+    the oldest ones evicted to keep at most that many. The wrapper exposes:
+    - `invalidate(*args, **kwargs)`: drop the entry for those arguments
+    - `cache_clear()`: drop every entry
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: dict[tuple, tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                value = entry[1]
+            else:
+                value = func(*args, **kwargs)
+                with lock:
+                    cache.pop(key, None)
+                    if maxsize is not None and len(cache) >= maxsize:
+                        for stale_key in [k for k, (expires, _) in cache.items() if expires <= now]:
+                            del cache[stale_key]
+                        while len(cache) >= maxsize:
+                            del cache[next(iter(cache))]
+                    cache[key] = (now + seconds, value)
+            return copy.deepcopy(value) if copy_result else value
+
+        def invalidate(*args, **kwargs) -> None:
+            with lock:
+                cache.pop(_make_key(args, kwargs), None)
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+def disk_cache(namespace: str, seconds: float) -> Callable:
+    """
+    Persist a function's JSON-serializable results as files under LIGHTDASH_CACHE_DIR
+    for `seconds`, so they survive server restarts. Does nothing when the variable is unset.
+
+    Entries are keyed by instance URL, a hash of the API token and the call arguments,
+    so different instances or users never share results. Cache I/O errors are ignored
+    and fall through to calling the function.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not CACHE_DIR:
+                return func(*args, **kwargs)
+
+            key = hashlib.sha256(
+                repr((lightdash_client.LIGHTDASH_URL, lightdash_client.LIGHTDASH_TOKEN, _make_key(args, kwargs))).encode()
+            ).hexdigest()
+            path = os.path.join(CACHE_DIR, f"{namespace}-{key}.json")
+            try:
+                if time.time() - os.path.getmtime(path) < seconds:
+                    with open(path, "rb") as f:
+                        return json_utils.loads(f.read())
+            except (OSError, ValueError):
+                pass
+
+            value = func(*args, **kwargs)
+            tmp_path = None
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(json_utils.dumpb(value))
+                # Atomic rename, so concurrent readers never see a partial file
+                os.replace(tmp_path, path)
+            except (OSError, TypeError):
+                if tmp_path and os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -1,11 +1,28 @@
-import json
+from itertools import chain
 
-import requests
-
-from .. import lightdash_client
+from .. import json_utils, lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
 from .get_project import get_project_uuid
+from .list_charts import invalidate_chart_cache
+
+
+# Checked in this order, so errors consistently report xRef before yRef
+_ENCODE_REFS = ("xRef", "yRef")
 
+def _additional_metric_ids(metric_query: dict):
+    """Yield the field IDs ("{table}_{name}") of the metric query's additional metrics"""
+    return (
+        f"{table}_{name}"
+        for am in metric_query.get("additionalMetrics", ())
+        if (table := am.get("table")) and (name := am.get("name"))
+    )
+
+def _merge_additional_metrics(metric_query: dict) -> list:
+    """
+    Return the metric query's metrics followed by its additional metric IDs,
+    deduplicated in order. The input is never mutated.
+    """
+    return list(dict.fromkeys(chain(metric_query.get("metrics", ()), _additional_metric_ids(metric_query))))
 
 def validate_chart_config(chart_config: dict, metric_query: dict) -> tuple[bool, str]:
     """
@@ -20,22 +37,14 @@ def validate_chart_config(chart_config: dict, metric_query: dict) -> tuple[bool,
     if "series" not in echarts_config or not isinstance(echarts_config["series"], list):
         return False, "eChartsConfig must have a 'series' list."
 
-    # Get all available fields from the metric query
-    available_fields = set(metric_query.get("dimensions", []))
-    available_fields.update(metric_query.get("metrics", []))
-    additional_metrics = metric_query.get("additionalMetrics", [])
-    for am in additional_metrics:
-        table = am.get("table", "")
-        name = am.get("name", "")
-        if table and name:
-            available_fields.add(f"{table}_{name}")
-    
-    # Add custom dimensions to available fields
-    custom_dimensions = metric_query.get("customDimensions", [])
-    for cd in custom_dimensions:
-        dim_id = cd.get("id", "")
-        if dim_id:
-            available_fields.add(dim_id)
+    # Get all available fields from the metric query: dimensions, metrics,
+    # additional metrics ("{table}_{name}") and custom dimensions
+    available_fields = frozenset(chain(
+        metric_query.get("dimensions", ()),
+        metric_query.get("metrics", ()),
+        _additional_metric_ids(metric_query),
+        (cd_id for cd in metric_query.get("customDimensions", ()) if (cd_id := cd.get("id"))),
+    ))
 
     # Check each series configuration
     for i, series in enumerate(echarts_config["series"]):
@@ -43,9 +52,8 @@ def validate_chart_config(chart_config: dict, metric_query: dict) -> tuple[bool,
             return False, f"Series {i} is missing 'encode' configuration."
         
         encode = series["encode"]
-        refs = {"xRef", "yRef"}
         
-        for ref_key in refs:
+        for ref_key in _ENCODE_REFS:
             if ref_key in encode:
                 ref_value = encode[ref_key]
                 if not isinstance(ref_value, dict) or "field" not in ref_value:
@@ -64,26 +72,17 @@ def build_table_config(metric_query: dict) -> dict:
     The order is dimensions, custom dimensions, then metrics, then table calculations.
     """
     dimensions = metric_query.get("dimensions", [])
-    metrics = metric_query.get("metrics", [])
-    table_calcs = [tc.get("name") for tc in metric_query.get("tableCalculations", []) if tc.get("name")]
+    metrics = _merge_additional_metrics(metric_query)
+    table_calcs = [tc_name for tc in metric_query.get("tableCalculations", ()) if (tc_name := tc.get("name"))]
     
     # Add custom dimensions to the dimensions list for column ordering
-    custom_dimensions = metric_query.get("customDimensions", [])
-    custom_dim_ids = [cd.get("id") for cd in custom_dimensions if cd.get("id")]
-    custom_dim_names = [cd.get("name") for cd in custom_dimensions if cd.get("name")]
-    
-    # Add additional metrics to the metrics list for column ordering
-    additional_metrics = metric_query.get("additionalMetrics", [])
-    for am in additional_metrics:
-        table = am.get("table", "")
-        name = am.get("name", "")
-        if table and name:
-            metric_field_id = f"{table}_{name}"
-            if metric_field_id not in metrics:
-                metrics.append(metric_field_id)
-
-    # Include both custom dimension IDs and names (Lightdash shows both)
-    column_order = dimensions + custom_dim_ids + custom_dim_names + metrics + table_calcs
+    custom_dimensions = metric_query.get("customDimensions", ())
+    custom_dim_ids = [cd_id for cd in custom_dimensions if (cd_id := cd.get("id"))]
+    custom_dim_names = [cd_name for cd in custom_dimensions if (cd_name := cd.get("name"))]
+
+    # Include both custom dimension IDs and names (Lightdash shows both);
+    # a field listed in several groups keeps its first position
+    column_order = list(dict.fromkeys(chain(dimensions, custom_dim_ids, custom_dim_names, metrics, table_calcs)))
     
     return {"columnOrder": column_order}
 
@@ -413,24 +412,14 @@ If validation fails, you'll get a detailed error message.
 def run(name: str, table_name: str, space_uuid: str, metric_query: str, chart_config: str, pivot_config: str = "", description: str = "") -> str:
     """Run the create chart tool"""
     try:
-        metric_query_data = json.loads(metric_query)
-        chart_config_data = json.loads(chart_config)
-        pivot_config_data = json.loads(pivot_config) if pivot_config else None
-    except json.JSONDecodeError as e:
+        metric_query_data = json_utils.loads(metric_query)
+        chart_config_data = json_utils.loads(chart_config)
+        pivot_config_data = json_utils.loads(pivot_config) if pivot_config else None
+    except json_utils.JSONDecodeError as e:
         return f"Error parsing JSON: {str(e)}"
 
-    additional_metrics = metric_query_data.get("additionalMetrics", [])
-    current_metrics = metric_query_data.get("metrics", [])
-    
-    for am in additional_metrics:
-        table = am.get("table", "")
-        name = am.get("name", "")
-        if table and name:
-            metric_field_id = f"{table}_{name}"
-            if metric_field_id not in current_metrics:
-                current_metrics.append(metric_field_id)
-    
-    metric_query_data["metrics"] = current_metrics
+    # Additional metrics must also be listed in metrics for proper display
+    metric_query_data["metrics"] = _merge_additional_metrics(metric_query_data)
     
     is_valid, error_msg = validate_chart_config(chart_config_data, metric_query_data)
     if not is_valid:
@@ -455,20 +444,13 @@ def run(name: str, table_name: str, space_uuid: str, metric_query: str, chart_co
     
     try:
         result = lightdash_client.post(f"/api/v1/projects/{project_uuid}/saved", data=chart_data)
-        new_chart_uuid = result.get("results", {}).get("uuid", "")
-        
-        pivot_info = f"\n\nPivot configuration: {json.dumps(pivot_config_data)}" if pivot_config_data else ""
-        
-        return f"✅ Successfully created chart '{name}' with UUID: {new_chart_uuid}\n\nColumns in table view: {table_config['columnOrder']}{pivot_info}"
-    except requests.HTTPError as e:
-        error_detail = str(e)
-        try:
-            error_json = e.response.json()
-            error_detail = json.dumps(error_json, indent=2)
-        except (ValueError, AttributeError):
-            try:
-                error_detail = e.response.text
-            except AttributeError:
-                error_detail = str(e)
-        
-        return f"❌ Failed to create chart '{name}':\n\n{error_detail}\n\nThe chart configuration passed validation but the API rejected it. This might indicate:\n- Invalid field references in filters\n- Table/explore '{table_name}' doesn't exist\n- Space UUID '{space_uuid}' is invalid\n\nUse get-explore-schema to verify table and field names."
+    except Exception as e:
+        # lightdash_client raises with the API's error body already in the message
+        return f"❌ Failed to create chart '{name}':\n\n{e}\n\nThe chart configuration passed validation but the API rejected it. This might indicate:\n- Invalid field references in filters\n- Table/explore '{table_name}' doesn't exist\n- Space UUID '{space_uuid}' is invalid\n\nUse get-explore-schema to verify table and field names."
+
+    invalidate_chart_cache()
+    new_chart_uuid = result.get("results", {}).get("uuid", "")
+    
+    pivot_info = f"\n\nPivot configuration: {json_utils.dumps(pivot_config_data)}" if pivot_config_data else ""
+    
+    return f"✅ Successfully created chart '{name}' with UUID: {new_chart_uuid}\n\nColumns in table view: {table_config['columnOrder']}{pivot_info}"
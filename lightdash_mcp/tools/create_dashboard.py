@@ -1,7 +1,7 @@
-import json
 
-from .. import lightdash_client
+from .. import json_utils, lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
+from .dashboard_utils import invalidate_dashboard_cache
 from .get_project import get_project_uuid
 
 TOOL_DEFINITION = ToolDefinition(
@@ -53,9 +53,9 @@ You can create an empty dashboard (just name and description) or a fully configu
 def run(name: str, description: str = "", tiles: str = "[]", tabs: str = "[]") -> str:
     """Run the create dashboard tool"""
     try:
-        tiles_data = json.loads(tiles)
-        tabs_data = json.loads(tabs)
-    except json.JSONDecodeError as e:
+        tiles_data = json_utils.loads(tiles)
+        tabs_data = json_utils.loads(tabs)
+    except json_utils.JSONDecodeError as e:
         return f"Error parsing tiles or tabs JSON: {str(e)}"
 
     dashboard_payload = {
@@ -67,6 +67,7 @@ def run(name: str, description: str = "", tiles: str = "[]", tabs: str = "[]") -
     
     project_uuid = get_project_uuid()
     response = lightdash_client.post(f"/api/v1/projects/{project_uuid}/dashboards", data=dashboard_payload)
+    invalidate_dashboard_cache()
     
     dashboard_uuid = response.get("results", {}).get("uuid", "")
     
@@ -1,11 +1,11 @@
-import json
 import uuid
+from typing import Any
 
-from .. import lightdash_client
+from .. import json_utils, lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .get_dashboard_tiles import get_dashboard
-from .get_project import get_project_uuid
-from .list_dashboards import run as list_dashboards
+from .dashboard_utils import find_dashboard_uuid, get_dashboard, get_dashboard_for_update
+
+_REQUIRED_TILE_PROPS = frozenset(("x", "y", "h", "w"))
 
 TOOL_DEFINITION = ToolDefinition(
     name="create-dashboard-tile",
@@ -49,7 +49,7 @@ TOOL_DEFINITION = ToolDefinition(
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching)"
+                description="Name of the dashboard (supports partial matching) or its UUID"
             ),
             "tile_type": ToolParameter(
                 type="string",
@@ -68,61 +68,52 @@ TOOL_DEFINITION = ToolDefinition(
     }
 )
 
-def run(dashboard_name: str, tile_type: str, properties: str, tab_uuid: str = None) -> str:
-    """Run the create dashboard tile tool"""
-    try:
-        properties_data = json.loads(properties)
-    except json.JSONDecodeError as e:
-        return f"Error parsing properties JSON: {str(e)}"
+def _append_tiles(dashboard_name: str, tile_specs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Append tiles to a dashboard with a single GET + PATCH round trip.
 
-    required_props = ["x", "y", "h", "w"]
-    missing_props = [p for p in required_props if p not in properties_data]
-    if missing_props:
-        raise ValueError(f"Missing required properties: {missing_props}. All tiles need x, y, h, w properties.")
+    Each spec is a dict with `tile_type`, `properties` (dict including x, y, h, w)
+    and an optional `tab_uuid`. Returns the newly created tile objects.
+    """
+    for spec in tile_specs:
+        missing_props = _REQUIRED_TILE_PROPS.difference(spec.get("properties", {}))
+        if missing_props:
+            raise ValueError(f"Missing required properties: {sorted(missing_props)}. All tiles need x, y, h, w properties.")
 
-    project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-    
-    if not dashboard_uuid:
-        for dash in dashboards:
-            if dashboard_name.lower() in dash.get("name", "").lower():
-                dashboard_uuid = dash.get("uuid")
-                break
-    
+    dashboard_uuid = find_dashboard_uuid(dashboard_name)
     if not dashboard_uuid:
         raise ValueError(f"Dashboard '{dashboard_name}' not found")
 
-    dashboard = get_dashboard(dashboard_uuid)
+    dashboard = get_dashboard_for_update(dashboard_uuid)
     tiles = dashboard.get("tiles", [])
     
-    x = properties_data.pop("x")
-    y = properties_data.pop("y")
-    h = properties_data.pop("h")
-    w = properties_data.pop("w")
-    
-    new_tile = {
-        "uuid": str(uuid.uuid4()),
-        "x": x,
-        "y": y,
-        "h": h,
-        "w": w,
-        "type": tile_type,
-        "properties": properties_data,
-        "tabUuid": None
-    }
-    
-    if tab_uuid:
-        new_tile["tabUuid"] = tab_uuid
-    elif dashboard.get("tabs"):
-        new_tile["tabUuid"] = dashboard["tabs"][0].get("uuid")
+    new_tiles = []
+    for spec in tile_specs:
+        properties_data = dict(spec["properties"])
+        x = properties_data.pop("x")
+        y = properties_data.pop("y")
+        h = properties_data.pop("h")
+        w = properties_data.pop("w")
         
-    tiles.append(new_tile)
+        new_tile = {
+            "uuid": str(uuid.uuid4()),
+            "x": x,
+            "y": y,
+            "h": h,
+            "w": w,
+            "type": spec["tile_type"],
+            "properties": properties_data,
+            "tabUuid": None
+        }
+        
+        if spec.get("tab_uuid"):
+            new_tile["tabUuid"] = spec["tab_uuid"]
+        elif dashboard.get("tabs"):
+            new_tile["tabUuid"] = dashboard["tabs"][0].get("uuid")
+            
+        new_tiles.append(new_tile)
+    
+    tiles.extend(new_tiles)
     
     update_payload = {
         "name": dashboard.get("name"),
@@ -132,5 +123,27 @@ def run(dashboard_name: str, tile_type: str, properties: str, tab_uuid: str = No
     }
     
     lightdash_client.patch(f"/api/v1/dashboards/{dashboard_uuid}", data=update_payload)
+    get_dashboard.invalidate(dashboard_uuid)
+    
+    return new_tiles
+
+def run_many(dashboard_name: str, tiles: list[dict[str, Any]]) -> str:
+    """Add several tiles to a dashboard in one PATCH"""
+    if not tiles:
+        return "No tiles provided."
+
+    new_tiles = _append_tiles(dashboard_name, tiles)
+    created = [f"{t['type']} ({t['uuid']})" for t in new_tiles]
+    
+    return f"Successfully created {len(new_tiles)} tiles on dashboard '{dashboard_name}': {', '.join(created)}"
+
+def run(dashboard_name: str, tile_type: str, properties: str, tab_uuid: str = None) -> str:
+    """Run the create dashboard tile tool"""
+    try:
+        properties_data = json_utils.loads(properties)
+    except json_utils.JSONDecodeError as e:
+        return f"Error parsing properties JSON: {str(e)}"
+
+    new_tile = _append_tiles(dashboard_name, [{"tile_type": tile_type, "properties": properties_data, "tab_uuid": tab_uuid}])[0]
     
     return f"Successfully created new tile of type '{tile_type}' on dashboard '{dashboard_name}' with UUID: {new_tile['uuid']}"
@@ -0,0 +1,52 @@
+from .. import json_utils
+from .base_tool import ToolDefinition, ToolParameter
+from .create_dashboard_tile import run_many
+
+TOOL_DEFINITION = ToolDefinition(
+    name="create-dashboard-tiles",
+    description="""Create several tiles on an existing dashboard in a single update.
+
+Works like create-dashboard-tile, but the dashboard is fetched and saved only once for the whole batch.
+
+**Each tile in the array needs:**
+- `tile_type`: One of 'saved_chart', 'markdown', 'loom'
+- `properties`: Object with `x`, `y`, `h`, `w` plus the tile-specific properties (see create-dashboard-tile)
+- Optional `tab_uuid`: Tab to place the tile on (defaults to the first tab)
+
+**CRITICAL - Grid system:** Dashboard is **36 columns wide**. For 2 tiles per row use `w: 18`, for 3 use `w: 12`.
+
+**When to use:**
+- To populate a new dashboard with many tiles at once
+- To lay out a row or section of tiles in one step
+
+**Returns:** The type and UUID of every created tile.""",
+    inputSchema={
+        "properties": {
+            "dashboard_name": ToolParameter(
+                type="string",
+                description="Name of the dashboard (supports partial matching) or its UUID"
+            ),
+            "tiles": ToolParameter(
+                type="string",
+                description="JSON array of tiles to create. Example: [{\"tile_type\": \"markdown\", \"properties\": {\"x\": 0, \"y\": 0, \"h\": 2, \"w\": 36, \"title\": \"Overview\", \"content\": \"# KPIs\"}}, {\"tile_type\": \"saved_chart\", \"properties\": {\"x\": 0, \"y\": 2, \"h\": 6, \"w\": 18, \"savedChartUuid\": \"uuid-here\"}}]"
+            )
+        },
+        "required": ["dashboard_name", "tiles"]
+    }
+)
+
+def run(dashboard_name: str, tiles: str) -> str:
+    """Run the create dashboard tiles tool"""
+    try:
+        tiles_data = json_utils.loads(tiles)
+    except json_utils.JSONDecodeError as e:
+        return f"Error parsing tiles JSON: {str(e)}"
+
+    if not isinstance(tiles_data, list):
+        return "Error: tiles must be a JSON array of tile objects."
+
+    for i, tile in enumerate(tiles_data):
+        if not isinstance(tile, dict) or "tile_type" not in tile or not isinstance(tile.get("properties"), dict):
+            return f"Error: tile {i} must be an object with 'tile_type' and a 'properties' object."
+
+    return run_many(dashboard_name, tiles_data)
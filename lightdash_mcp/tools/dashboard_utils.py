@@ -1,74 +1,152 @@
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from .. import lightdash_client
+from .cache_utils import ttl_cache
 from .get_project import get_project_uuid
 from .list_dashboards import run as list_dashboards
-from .run_raw_query import run as run_metric_query
-from .utils import flatten_rows
+from .run_raw_query import execute_metric_query
+from .utils import iter_flat_rows, normalize_uuid
 
 
+@ttl_cache(seconds=60, copy_result=False)
+def _dashboard_index(project_uuid: str) -> Tuple[Dict[str, str], List[Tuple[str, str]]]:
+    """
+    Build case-folded name lookups for a project's dashboards:
+    an exact-name dict and an ordered (name, uuid) list for partial matches.
+    """
+    exact: Dict[str, str] = {}
+    partial: List[Tuple[str, str]] = []
+    for dash in list_dashboards(project_uuid):
+        name = (dash.get("name") or "").casefold()
+        exact.setdefault(name, dash.get("uuid"))
+        partial.append((name, dash.get("uuid")))
+    return exact, partial
+
+def find_dashboard_uuid(dashboard_name: str, project_uuid: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve a dashboard name to its UUID. Matching is case-insensitive and ranks
+    an exact name over a name starting with the search term over a substring match.
+    """
+    # A UUID needs no name resolution, so skip the dashboard listing round-trip
+    if dashboard_uuid := normalize_uuid(dashboard_name):
+        return dashboard_uuid
+    if not project_uuid:
+        project_uuid = get_project_uuid()
+    exact, partial = _dashboard_index(project_uuid)
+    needle = dashboard_name.casefold()
+    if needle in exact:
+        return exact[needle]
+
+    # Single pass: stop at the first prefix match, remembering the first substring match
+    substring_match = None
+    for name, uuid in partial:
+        if name.startswith(needle):
+            return uuid
+        if substring_match is None and needle in name:
+            substring_match = uuid
+    return substring_match
+
+def invalidate_dashboard_cache() -> None:
+    """Drop cached dashboard listings after a dashboard is created or removed"""
+    list_dashboards.cache_clear()
+    _dashboard_index.cache_clear()
+
+@ttl_cache(seconds=15)
+def get_dashboard(dashboard_uuid: str) -> dict[str, Any]:
+    """Fetch a full dashboard; callers that PATCH it must call get_dashboard.invalidate(uuid)"""
+    response = lightdash_client.get(f"/api/v1/dashboards/{dashboard_uuid}")
+    return response.get("results", {})
+
+def get_dashboard_for_update(dashboard_uuid: str) -> dict[str, Any]:
+    """
+    Fetch a dashboard that is about to be modified and PATCHed back in full.
+    Bypasses the 15s memo so edits made elsewhere are not overwritten with a stale
+    tile list; the conditional GET keeps this to a 304 when nothing changed.
+    """
+    get_dashboard.invalidate(dashboard_uuid)
+    return get_dashboard(dashboard_uuid)
+
 def get_dashboard_by_name(dashboard_name: str) -> dict[str, Any]:
-    """Helper to find and fetch full dashboard object by name"""
-    project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    # Exact match first
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-    
-    # Partial match fallback
-    if not dashboard_uuid:
-        for dash in dashboards:
-            if dashboard_name.lower() in dash.get("name", "").lower():
-                dashboard_uuid = dash.get("uuid")
-                break
-                
+    """
+    Helper to find and fetch full dashboard object by name or UUID.
+    Project UUID, name index and dashboard body all come from short-lived caches,
+    so repeated calls within a workflow cost no extra round trips.
+    """
+    dashboard_uuid = find_dashboard_uuid(dashboard_name)
     if not dashboard_uuid:
         raise ValueError(f"Dashboard '{dashboard_name}' not found")
 
-    response = lightdash_client.get(f"/api/v1/dashboards/{dashboard_uuid}")
-    return response.get("results", {})
+    return get_dashboard(dashboard_uuid)
+
+def tile_title(tile: Dict[str, Any]) -> str:
+    """A tile's display title, falling back to its chart name"""
+    props = tile.get("properties") or {}
+    return props.get("title") or props.get("chartName") or ""
+
+def find_tile_index(tiles: List[Dict[str, Any]], tile_identifier: str) -> Optional[int]:
+    """Index of the first tile whose title contains tile_identifier (case-insensitive), or None"""
+    needle = tile_identifier.casefold()
+    return next((i for i, tile in enumerate(tiles) if needle in tile_title(tile).casefold()), None)
+
+def _is_empty_group(group: Any) -> bool:
+    """
+    True for a missing/empty group, or one whose 'and'/'or' keys are present and all empty.
+    Anything else (a single rule, a group shaped unexpectedly) is kept and merged as-is.
+    """
+    if not group:
+        return True
+    # Dashboards store each filter group as a plain list of rules
+    if isinstance(group, list):
+        return False
+    branches = [group[key] for key in ("and", "or") if key in group]
+    return bool(branches) and not any(branches)
+
+def _and_children(group: Any) -> List[Dict[str, Any]]:
+    """Conditions of a pure 'and' group or rule list (spliceable into another 'and'), else the group itself"""
+    if isinstance(group, list):
+        return group
+    if "and" in group and "or" not in group:
+        return group["and"]
+    return [group]
+
+def _merge_filter_group(c_group: Dict[str, Any], d_group: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    AND two filter groups together, returning one side unchanged when the other is empty.
+    'and' groups are spliced into a single root rather than nested, keeping the tree shallow.
+    """
+    if _is_empty_group(d_group):
+        return c_group or {}
+    if _is_empty_group(c_group):
+        return d_group
+    return {
+        "id": "merged_root",
+        "and": [*_and_children(c_group), *_and_children(d_group)]
+    }
 
 def _merge_filters(chart_filters: Dict[str, Any], dashboard_filters: Dict[str, Any]) -> Dict[str, Any]:
     """
     Merge dashboard filters into chart filters.
     Strategy: Create a new root 'and' group containing the original chart filters and the dashboard filters.
     """
-    if not dashboard_filters:
+    # Dashboards usually carry {"dimensions": [], "metrics": []}: nothing to merge, so no new dicts
+    if not dashboard_filters or (
+        _is_empty_group(dashboard_filters.get("dimensions")) and _is_empty_group(dashboard_filters.get("metrics"))
+    ):
         return chart_filters
     
     if not chart_filters:
         return {"dimensions": dashboard_filters.get("dimensions", {}), "metrics": dashboard_filters.get("metrics", {})}
 
-    merged = {"dimensions": {}, "metrics": {}}
-    
-    def merge_group(type_key):
-        c_group = chart_filters.get(type_key, {})
-        d_group = dashboard_filters.get(type_key, {})
-        
-        if not c_group and not d_group:
-            return {}
-        if not c_group:
-            return d_group
-        if not d_group:
-            return c_group
-            
-        return {
-            "id": "merged_root",
-            "and": [
-                c_group,
-                d_group
-            ]
-        }
+    return {
+        "dimensions": _merge_filter_group(chart_filters.get("dimensions"), dashboard_filters.get("dimensions")),
+        "metrics": _merge_filter_group(chart_filters.get("metrics"), dashboard_filters.get("metrics")),
+    }
 
-    merged["dimensions"] = merge_group("dimensions")
-    merged["metrics"] = merge_group("metrics")
-    
-    return merged
+# Distinguishes "no tileTargets entry for this tile" from an explicit null target
+_NO_TILE_TARGET = object()
+
+_FILTER_GROUPS = ("dimensions", "metrics", "tableCalculations")
 
 def _resolve_tile_targets(filters: List[Dict[str, Any]], tile_uuid: str) -> List[Dict[str, Any]]:
     """
@@ -82,12 +160,11 @@ def _resolve_tile_targets(filters: List[Dict[str, Any]], tile_uuid: str) -> List
         tile_targets = f.get("tileTargets", {})
         
         # Determine the target for this tile
-        if tile_uuid in tile_targets:
-            tile_target = tile_targets[tile_uuid]
+        target = tile_targets.get(tile_uuid, _NO_TILE_TARGET)
+        if target is not _NO_TILE_TARGET:
             # If tileTarget is False, this filter doesn't apply to this tile - skip it
-            if tile_target is False:
+            if target is False:
                 continue
-            target = tile_target
         else:
             target = f.get("target", {})
             # If there's no tileTarget and no default target, skip this filter
@@ -120,9 +197,58 @@ def _resolve_tile_targets(filters: List[Dict[str, Any]], tile_uuid: str) -> List
         resolved.append(resolved_filter)
     return resolved
 
+def _resolve_dashboard_filters(dashboard_filters: Dict[str, Any], tile_uuid: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Resolve every dashboard filter group (dimensions, metrics, tableCalculations) for one tile"""
+    return {
+        group: _resolve_tile_targets(dashboard_filters.get(group) or (), tile_uuid)
+        for group in _FILTER_GROUPS
+    }
+
 
-def execute_dashboard_tile(tile: dict[str, Any], dashboard_filters: dict[str, Any], dashboard_uuid: str) -> dict[str, Any]:
-    """Execute a single dashboard tile with filters using v2 API"""
+# Async query polling: start with a short delay so fast queries return quickly,
+# back off towards the cap for slow ones. The deadline matches the previous 30 x 0.5s.
+_POLL_INITIAL_DELAY = 0.05
+_POLL_MAX_DELAY = 0.5
+_POLL_BACKOFF = 1.5
+_POLL_TIMEOUT = 15.0
+
+def _poll_query_results(project_uuid: str, query_uuid: str, timeout: float = _POLL_TIMEOUT) -> dict[str, Any]:
+    """Poll an async v2 query until it is ready (or the timeout passes) and return its results"""
+    results_url = f"/api/v2/projects/{project_uuid}/query/{query_uuid}"
+    deadline = time.monotonic() + timeout
+    delay = _POLL_INITIAL_DELAY
+    last_status = None
+    
+    while True:
+        query_results = lightdash_client.get(results_url).get("results") or {}
+        status = query_results.get("status", "")
+        
+        if status == "ready":
+            return query_results
+        elif status in ("error", "failed"):
+            raise ValueError(f"Query failed with status: {status}")
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return query_results
+        
+        # Query still running: poll quickly again after a status change (e.g. queued -> running),
+        # otherwise wait progressively longer
+        if status != last_status:
+            delay = _POLL_INITIAL_DELAY
+            last_status = status
+        time.sleep(min(delay, remaining))
+        delay = min(delay * _POLL_BACKOFF, _POLL_MAX_DELAY)
+
+def execute_dashboard_tile(tile: dict[str, Any], dashboard_filters: dict[str, Any], dashboard_uuid: str, project_uuid: Optional[str] = None) -> dict[str, Any]:
+    """
+    Execute a single dashboard tile with filters using v2 API.
+    Pass project_uuid when running many tiles so it is resolved once by the caller.
+    "rows" is a single-use iterator of flattened rows, so the flattened copy of a
+    large result never has to exist alongside the raw one.
+    """
+    if not project_uuid:
+        project_uuid = get_project_uuid()
     tile_uuid = tile.get("uuid")
     tile_type = tile.get("type")
     props = tile.get("properties", {})
@@ -134,16 +260,11 @@ def execute_dashboard_tile(tile: dict[str, Any], dashboard_filters: dict[str, An
         
         # Use v2 endpoint which properly handles dashboard filters with tileTargets
         # See: https://docs.lightdash.com/api-reference/query/execute-dashboard-chart
-        project_uuid = get_project_uuid()
         url = f"/api/v2/projects/{project_uuid}/query/dashboard-chart"
         
         # Resolve tileTargets - the UI pre-resolves target using tileTargets[tileUuid]
         # before sending to the API. We must do the same.
-        resolved_filters = {
-            "dimensions": _resolve_tile_targets(dashboard_filters.get("dimensions", []), tile_uuid),
-            "metrics": _resolve_tile_targets(dashboard_filters.get("metrics", []), tile_uuid),
-            "tableCalculations": _resolve_tile_targets(dashboard_filters.get("tableCalculations", []), tile_uuid)
-        }
+        resolved_filters = _resolve_dashboard_filters(dashboard_filters, tile_uuid)
         
         payload = {
             "context": "dashboardView",
@@ -159,8 +280,7 @@ def execute_dashboard_tile(tile: dict[str, Any], dashboard_filters: dict[str, An
         }
         
         # Step 1: Execute the query (async) - returns queryUuid
-        response = lightdash_client.post(url, data=payload)
-        results = response.get("results", {})
+        results = lightdash_client.post(url, data=payload).get("results") or {}
         query_uuid = results.get("queryUuid")
         fields = results.get("fields", {})
         
@@ -168,26 +288,11 @@ def execute_dashboard_tile(tile: dict[str, Any], dashboard_filters: dict[str, An
             raise ValueError("No queryUuid returned from dashboard-chart endpoint")
         
         # Step 2: Fetch the actual rows using the queryUuid (with polling)
-        results_url = f"/api/v2/projects/{project_uuid}/query/{query_uuid}"
-        
-        max_attempts = 30
-        for attempt in range(max_attempts):
-            results_response = lightdash_client.get(results_url)
-            query_results = results_response.get("results", {})
-            status = query_results.get("status", "")
-            
-            if status == "ready":
-                break
-            elif status in ("error", "failed"):
-                raise ValueError(f"Query failed with status: {status}")
-            
-            # Query still running, wait and retry
-            time.sleep(0.5)
-        
-        rows = query_results.get("rows", [])
+        query_results = _poll_query_results(project_uuid, query_uuid)
+        rows = query_results.get("rows", ())
         
         return {
-            "rows": flatten_rows(rows),
+            "rows": iter_flat_rows(rows),
             "row_count": len(rows),
             "fields": fields
         }
@@ -198,7 +303,6 @@ def execute_dashboard_tile(tile: dict[str, Any], dashboard_filters: dict[str, An
         if not saved_sql_uuid:
             raise ValueError(f"SQL chart tile {tile_uuid} missing savedSqlUuid")
         
-        project_uuid = get_project_uuid()
         url = f"/api/v2/projects/{project_uuid}/query/sql-chart"
         
         payload = {
@@ -208,34 +312,18 @@ def execute_dashboard_tile(tile: dict[str, Any], dashboard_filters: dict[str, An
         }
         
         # Step 1: Execute the query (async) - returns queryUuid
-        response = lightdash_client.post(url, data=payload)
-        results = response.get("results", {})
+        results = lightdash_client.post(url, data=payload).get("results") or {}
         query_uuid = results.get("queryUuid")
         
         if not query_uuid:
             raise ValueError("No queryUuid returned from sql-chart endpoint")
         
         # Step 2: Fetch the actual rows using the queryUuid (with polling)
-        results_url = f"/api/v2/projects/{project_uuid}/query/{query_uuid}"
-        
-        max_attempts = 30
-        for attempt in range(max_attempts):
-            results_response = lightdash_client.get(results_url)
-            query_results = results_response.get("results", {})
-            status = query_results.get("status", "")
-            
-            if status == "ready":
-                break
-            elif status in ("error", "failed"):
-                raise ValueError(f"Query failed with status: {status}")
-            
-            # Query still running, wait and retry
-            time.sleep(0.5)
-        
-        rows = query_results.get("rows", [])
+        query_results = _poll_query_results(project_uuid, query_uuid)
+        rows = query_results.get("rows", ())
         
         return {
-            "rows": flatten_rows(rows),
+            "rows": iter_flat_rows(rows),
             "row_count": len(rows),
             "fields": query_results.get("columns", {})
         }
@@ -256,12 +344,10 @@ def execute_dashboard_tile(tile: dict[str, Any], dashboard_filters: dict[str, An
         else:
              explore_name = chart_config.get("tableName")
         
-        # Merge filters
-        original_filters = metric_query.get("filters", {})
-        merged_filters = _merge_filters(original_filters, dashboard_filters)
-        metric_query["filters"] = merged_filters
+        # Merge filters into a copy, leaving the tile's own metric query untouched
+        query = {**metric_query, "filters": _merge_filters(metric_query.get("filters", {}), dashboard_filters)}
         
-        return run_metric_query(explore_name, metric_query)
+        return execute_metric_query(explore_name, query, project_uuid=project_uuid)
 
     else:
         raise ValueError(f"Tile '{tile_uuid}' is of type '{tile_type}' and cannot be executed as a chart.")
@@ -1,6 +1,9 @@
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .list_charts import run as list_charts
+from .get_chart_details import get_chart
+from .list_charts import find_chart, invalidate_chart_cache
+from .run_chart_query import invalidate_chart_results
+from .utils import normalize_uuid
 
 TOOL_DEFINITION = ToolDefinition(
     name="delete-chart",
@@ -32,19 +35,19 @@ TOOL_DEFINITION = ToolDefinition(
 
 def run(chart_identifier: str) -> str:
     """Run the delete chart tool"""
-    charts = list_charts()
-    
-    chart_uuid = None
-    chart_name = ""
-    for chart in charts:
-        if chart.get("uuid") == chart_identifier or chart.get("name", "").lower() == chart_identifier.lower():
-            chart_uuid = chart.get("uuid")
-            chart_name = chart.get("name")
-            break
-            
-    if not chart_uuid:
-        raise ValueError(f"Chart '{chart_identifier}' not found")
+    # UUIDs resolve directly (the fetch is cached and also covers charts saved in a
+    # dashboard); names go through the cached case-insensitive name index
+    if chart_uuid := normalize_uuid(chart_identifier):
+        chart_name = get_chart(chart_uuid).get("name") or chart_uuid
+    else:
+        match = find_chart(chart_identifier)
+        if not match:
+            raise ValueError(f"Chart '{chart_identifier}' not found")
+        chart_uuid, chart_name = match
         
     lightdash_client.delete(f"/api/v1/saved/{chart_uuid}")
+    get_chart.invalidate(chart_uuid)
+    invalidate_chart_cache()
+    invalidate_chart_results()
     
     return f"Successfully deleted chart '{chart_name}'"
@@ -1,8 +1,6 @@
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .get_dashboard_tiles import get_dashboard
-from .get_project import get_project_uuid
-from .list_dashboards import run as list_dashboards
+from .dashboard_utils import find_dashboard_uuid, find_tile_index, get_dashboard, get_dashboard_for_update, tile_title
 
 TOOL_DEFINITION = ToolDefinition(
     name="delete-dashboard-tile",
@@ -26,7 +24,7 @@ This permanently removes a tile from the dashboard. The operation cannot be undo
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching)"
+                description="Name of the dashboard (supports partial matching) or its UUID"
             ),
             "tile_identifier": ToolParameter(
                 type="string",
@@ -39,48 +37,20 @@ This permanently removes a tile from the dashboard. The operation cannot be undo
 
 def run(dashboard_name: str, tile_identifier: str) -> str:
     """Run the delete dashboard tile tool"""
-    project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-    
-    if not dashboard_uuid:
-        for dash in dashboards:
-            if dashboard_name.lower() in dash.get("name", "").lower():
-                dashboard_uuid = dash.get("uuid")
-                break
-    
+    dashboard_uuid = find_dashboard_uuid(dashboard_name)
     if not dashboard_uuid:
         raise ValueError(f"Dashboard '{dashboard_name}' not found")
 
-    dashboard = get_dashboard(dashboard_uuid)
+    dashboard = get_dashboard_for_update(dashboard_uuid)
     tiles = dashboard.get("tiles", [])
     
-    tile_found = False
-    deleted_tile_title = ""
-    deleted_tile_uuid = ""
-    
-    tile_index_to_delete = -1
-    
-    for i, tile in enumerate(tiles):
-        props = tile.get("properties", {})
-        title = str(props.get("title") or props.get("chartName") or "")
-        
-        if tile_identifier.lower() in title.lower():
-            tile_found = True
-            tile_index_to_delete = i
-            deleted_tile_title = title
-            deleted_tile_uuid = tile.get('uuid')
-            break
-            
-    if not tile_found:
+    tile_index = find_tile_index(tiles, tile_identifier)
+    if tile_index is None:
         raise ValueError(f"Tile matching '{tile_identifier}' not found on dashboard '{dashboard_name}'")
 
-    tiles.pop(tile_index_to_delete)
+    deleted_tile = tiles.pop(tile_index)
+    deleted_tile_title = tile_title(deleted_tile)
+    deleted_tile_uuid = deleted_tile.get("uuid")
     
     update_payload = {
         "name": dashboard.get("name"),
@@ -90,5 +60,6 @@ def run(dashboard_name: str, tile_identifier: str) -> str:
     }
     
     lightdash_client.patch(f"/api/v1/dashboards/{dashboard_uuid}", data=update_payload)
+    get_dashboard.invalidate(dashboard_uuid)
     
     return f"Successfully deleted tile '{deleted_tile_title}' (UUID: {deleted_tile_uuid}) from dashboard '{dashboard_name}'"
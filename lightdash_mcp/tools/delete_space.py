@@ -1,5 +1,7 @@
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
+from .dashboard_utils import invalidate_dashboard_cache
+from .list_charts import invalidate_chart_cache
 from .list_spaces import run as list_spaces
 from .get_project import get_project_uuid
 
@@ -38,10 +40,11 @@ def run(space_identifier: str) -> str:
     """Run the delete space tool"""
     spaces = list_spaces()
     
+    needle = space_identifier.casefold()
     space_uuid = None
     space_name = ""
     for space in spaces:
-        if space.get("uuid") == space_identifier or space.get("name", "").lower() == space_identifier.lower():
+        if space.get("uuid") == space_identifier or (space.get("name") or "").casefold() == needle:
             space_uuid = space.get("uuid")
             space_name = space.get("name")
             break
@@ -51,5 +54,8 @@ def run(space_identifier: str) -> str:
     
     project_uuid = get_project_uuid()
     lightdash_client.delete(f"/api/v1/projects/{project_uuid}/spaces/{space_uuid}")
+    # Deleting a space removes its charts and dashboards, so cached listings are stale
+    invalidate_chart_cache()
+    invalidate_dashboard_cache()
     
     return f"Successfully deleted space '{space_name}'"
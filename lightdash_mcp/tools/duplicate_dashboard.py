@@ -1,10 +1,11 @@
+import os
 import uuid
+from typing import Any, Iterator
 
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .get_dashboard_tiles import get_dashboard
+from .dashboard_utils import find_dashboard_uuid, get_dashboard, invalidate_dashboard_cache
 from .get_project import get_project_uuid
-from .list_dashboards import run as list_dashboards
 
 TOOL_DEFINITION = ToolDefinition(
     name="duplicate-dashboard",
@@ -37,7 +38,7 @@ This copies everything from the source dashboard:
         "properties": {
             "source_dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard to copy (supports partial matching)"
+                description="Name of the dashboard to copy (supports partial matching) or its UUID"
             ),
             "new_dashboard_name": ToolParameter(
                 type="string",
@@ -52,17 +53,31 @@ This copies everything from the source dashboard:
     }
 )
 
+def _uuid4_batch(count: int) -> Iterator[str]:
+    """Yield `count` random (version 4) UUID strings drawn from a single os.urandom call"""
+    raw = os.urandom(16 * count)
+    for i in range(0, 16 * count, 16):
+        yield str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+
+def _remap_tab_uuids(tabs: list[dict[str, Any]], tiles: list[dict[str, Any]]) -> None:
+    """Give tabs and tiles fresh UUIDs in place, pointing tiles at their tab's new UUID"""
+    # Regenerate tab UUIDs first, then remap tiles in a single pass
+    new_uuids = _uuid4_batch(len(tabs) + len(tiles))
+    tab_uuid_map: dict[str, str] = {tab["uuid"]: next(new_uuids) for tab in tabs if "uuid" in tab}
+    for tab in tabs:
+        if "uuid" in tab:
+            tab["uuid"] = tab_uuid_map[tab["uuid"]]
+
+    for tile in tiles:
+        if "uuid" in tile:
+            tile["uuid"] = next(new_uuids)
+        if tile.get("tabUuid") in tab_uuid_map:
+            tile["tabUuid"] = tab_uuid_map[tile["tabUuid"]]
+
 def run(source_dashboard_name: str, new_dashboard_name: str, new_description: str = "") -> str:
     """Run the duplicate dashboard tool"""
     project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    source_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == source_dashboard_name.lower():
-            source_uuid = dash.get("uuid")
-            break
-            
+    source_uuid = find_dashboard_uuid(source_dashboard_name, project_uuid)
     if not source_uuid:
         raise ValueError(f"Source dashboard '{source_dashboard_name}' not found")
         
@@ -76,20 +91,10 @@ def run(source_dashboard_name: str, new_dashboard_name: str, new_description: st
         "tabs": source_dashboard.get("tabs", [])
     }
     
-    for tile in new_dashboard_data["tiles"]:
-        if "uuid" in tile:
-            tile["uuid"] = str(uuid.uuid4())
-            
-    for tab in new_dashboard_data["tabs"]:
-        if "uuid" in tab:
-            old_uuid = tab["uuid"]
-            new_uuid = str(uuid.uuid4())
-            tab["uuid"] = new_uuid
-            for tile in new_dashboard_data["tiles"]:
-                if tile.get("tabUuid") == old_uuid:
-                    tile["tabUuid"] = new_uuid
+    _remap_tab_uuids(new_dashboard_data["tabs"], new_dashboard_data["tiles"])
                     
     result = lightdash_client.post(f"/api/v1/projects/{project_uuid}/dashboards", data=new_dashboard_data)
+    invalidate_dashboard_cache()
     new_uuid = result.get("results", {}).get("uuid", "")
     
     return f"Successfully duplicated dashboard '{source_dashboard_name}' to '{new_dashboard_name}' with UUID: {new_uuid}"
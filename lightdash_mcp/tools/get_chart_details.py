@@ -1,9 +1,10 @@
-import uuid
 from typing import Any
 
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .list_charts import run as list_charts
+from .cache_utils import ttl_cache
+from .list_charts import find_chart
+from .utils import normalize_uuid
 
 TOOL_DEFINITION = ToolDefinition(
     name="get-chart-details",
@@ -37,34 +38,21 @@ them directly. To find a dashboard tile's chart by name, use get-dashboard-tile-
     }
 )
 
+@ttl_cache(seconds=30)
 def get_chart(chart_uuid: str) -> dict[str, Any]:
     response = lightdash_client.get(f"/api/v1/saved/{chart_uuid}")
     return response.get("results", {})
 
-def _looks_like_uuid(value: str) -> bool:
-    try:
-        uuid.UUID(str(value))
-        return True
-    except (ValueError, AttributeError, TypeError):
-        return False
-
 def run(chart_identifier: str) -> dict[str, Any]:
     """Run the get chart details tool"""
     # A UUID may be a chart saved *within a dashboard* — absent from list-charts
     # (/projects/{uuid}/charts returns Space charts only). Resolve it directly via
     # /api/v1/saved/{uuid}; a bad UUID surfaces the real API error, not "not found".
-    if _looks_like_uuid(chart_identifier):
-        return get_chart(chart_identifier)
-
-    charts = list_charts()
-
-    chart_uuid = None
-    for chart in charts:
-        if chart.get("name", "").lower() == chart_identifier.lower():
-            chart_uuid = chart.get("uuid")
-            break
+    if chart_uuid := normalize_uuid(chart_identifier):
+        return get_chart(chart_uuid)
 
-    if not chart_uuid:
+    match = find_chart(chart_identifier)
+    if not match:
         raise ValueError(f"Chart '{chart_identifier}' not found. Use list-charts to see available charts.")
 
-    return get_chart(chart_uuid)
+    return get_chart(match[0])
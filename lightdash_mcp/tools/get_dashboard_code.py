@@ -1,9 +1,7 @@
 from typing import Any
 
 from .base_tool import ToolDefinition, ToolParameter
-from .get_dashboard_tiles import get_dashboard
-from .get_project import get_project_uuid
-from .list_dashboards import run as list_dashboards
+from .dashboard_utils import find_dashboard_uuid, get_dashboard
 
 TOOL_DEFINITION = ToolDefinition(
     name="get-dashboard-code",
@@ -34,7 +32,7 @@ Returns the raw dashboard configuration as code, including:
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching)"
+                description="Name of the dashboard (supports partial matching) or its UUID"
             )
         },
         "required": ["dashboard_name"]
@@ -43,15 +41,7 @@ Returns the raw dashboard configuration as code, including:
 
 def run(dashboard_name: str) -> dict[str, Any]:
     """Run the get dashboard code tool"""
-    project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-            
+    dashboard_uuid = find_dashboard_uuid(dashboard_name)
     if not dashboard_uuid:
         raise ValueError(f"Dashboard '{dashboard_name}' not found")
         
@@ -1,15 +1,8 @@
 from typing import Any
 
-from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .get_dashboard_tiles import get_dashboard
-from .get_project import get_project_uuid
-from .list_dashboards import run as list_dashboards
-
-
-def get_chart(chart_uuid: str) -> dict[str, Any]:
-    response = lightdash_client.get(f"/api/v1/saved/{chart_uuid}")
-    return response.get("results", {})
+from .dashboard_utils import find_tile_index, get_dashboard_by_name, tile_title
+from .get_chart_details import get_chart
 
 TOOL_DEFINITION = ToolDefinition(
     name="get-dashboard-tile-chart-config",
@@ -34,13 +27,13 @@ directly in the dashboard tile structure. This tool extracts that complete confi
 - Before modifying a dashboard tile's chart
 
 **Parameters:**
-- dashboard_name: Name of the dashboard (supports partial matching)
+- dashboard_name: Name of the dashboard (supports partial matching) or its UUID
 - tile_identifier: Title of the tile or partial match""",
     inputSchema={
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching)"
+                description="Name of the dashboard (supports partial matching) or its UUID"
             ),
             "tile_identifier": ToolParameter(
                 type="string",
@@ -53,53 +46,22 @@ directly in the dashboard tile structure. This tool extracts that complete confi
 
 def run(dashboard_name: str, tile_identifier: str) -> dict[str, Any]:
     """Run the get dashboard tile chart config tool"""
-    project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-    
-    if not dashboard_uuid:
-        for dash in dashboards:
-            if dashboard_name.lower() in dash.get("name", "").lower():
-                dashboard_uuid = dash.get("uuid")
-                break
-    
-    if not dashboard_uuid:
-        raise ValueError(f"Dashboard '{dashboard_name}' not found")
-
-    dashboard = get_dashboard(dashboard_uuid)
+    dashboard = get_dashboard_by_name(dashboard_name)
     tiles = dashboard.get("tiles", [])
     
-    target_tile = None
-    for tile in tiles:
-        props = tile.get("properties", {})
-        title = props.get("title", "") or props.get("chartName", "")
-        
-        if tile_identifier.lower() in title.lower():
-            target_tile = tile
-            break
-            
-    if not target_tile:
-        available_tiles = []
-        for tile in tiles:
-            props = tile.get("properties", {})
-            title = props.get("title", "") or props.get("chartName", "")
-            if title:
-                available_tiles.append(title)
-        
+    tile_index = find_tile_index(tiles, tile_identifier)
+    if tile_index is None:
+        available_tiles = [title for title in map(tile_title, tiles) if title]
         raise ValueError(f"Tile '{tile_identifier}' not found on dashboard. Available tiles: {available_tiles}")
 
+    target_tile = tiles[tile_index]
     tile_type = target_tile.get("type")
     props = target_tile.get("properties", {})
     
     result = {
         "tile_uuid": target_tile.get("uuid"),
         "tile_type": tile_type,
-        "title": props.get("title", "") or props.get("chartName", ""),
+        "title": tile_title(target_tile),
         "position": {
             "x": target_tile.get("x"),
             "y": target_tile.get("y"),
@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
+from .dashboard_utils import find_dashboard_uuid, get_dashboard, tile_title
+from .get_chart_details import get_chart
 from .get_project import get_project_uuid
 from .list_dashboards import run as list_dashboards
 
@@ -29,7 +31,7 @@ Returns a list of all tiles on the dashboard with their:
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching, e.g., 'Scale' will match 'Scale Dashboard')"
+                description="Name of the dashboard (supports partial matching, e.g., 'Scale' will match 'Scale Dashboard') or its UUID"
             ),
             "include_full_config": ToolParameter(
                 type="boolean",
@@ -40,28 +42,35 @@ Returns a list of all tiles on the dashboard with their:
     }
 )
 
-def get_dashboard(dashboard_uuid: str) -> dict[str, Any]:
-    response = lightdash_client.get(f"/api/v1/dashboards/{dashboard_uuid}")
-    return response.get("results", {})
+def _fetch_saved_chart_configs(chart_uuids: list[str]) -> dict[str, dict[str, Any]]:
+    """Fetch saved chart configurations concurrently, keyed by chart UUID"""
+    def fetch(chart_uuid: str) -> dict[str, Any]:
+        try:
+            chart = get_chart(chart_uuid)
+        except Exception as e:
+            return {"error": f"Could not fetch saved chart: {str(e)}"}
+        return {
+            "name": chart.get("name"),
+            "tableName": chart.get("tableName"),
+            "metricQuery": chart.get("metricQuery"),
+            "chartConfig": chart.get("chartConfig"),
+            "tableConfig": chart.get("tableConfig"),
+            "pivotConfig": chart.get("pivotConfig"),
+            "updatedAt": chart.get("updatedAt")
+        }
+
+    if not chart_uuids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(chart_uuids))) as executor:
+        return dict(zip(chart_uuids, executor.map(fetch, chart_uuids)))
 
 def run(dashboard_name: str, include_full_config: bool = False) -> list[dict[str, Any]]:
     """Run the get dashboard tiles tool"""
     project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-    
-    if not dashboard_uuid:
-        for dash in dashboards:
-            if dashboard_name.lower() in dash.get("name", "").lower():
-                dashboard_uuid = dash.get("uuid")
-                break
+    dashboard_uuid = find_dashboard_uuid(dashboard_name, project_uuid)
     
     if not dashboard_uuid:
+        dashboards = list_dashboards(project_uuid)
         raise ValueError(f"Dashboard '{dashboard_name}' not found. Available dashboards: {[d.get('name') for d in dashboards]}")
     
     dashboard = get_dashboard(dashboard_uuid)
@@ -81,7 +90,7 @@ def run(dashboard_name: str, include_full_config: bool = False) -> list[dict[str
         }
         
         props = tile.get("properties", {})
-        tile_info["title"] = props.get("title", "") or props.get("chartName", "")
+        tile_info["title"] = tile_title(tile)
         
         if tile.get("type") == "saved_chart":
             if "savedChartUuid" in props:
@@ -110,5 +119,18 @@ def run(dashboard_name: str, include_full_config: bool = False) -> list[dict[str
                 }
         
         result.append(tile_info)
+    
+    if include_full_config:
+        # Saved charts only carry a reference in the dashboard, so fetch each distinct one in parallel
+        saved_chart_uuids = list(dict.fromkeys(
+            t["chart_configuration"]["savedChartUuid"]
+            for t in result
+            if t.get("chart_configuration", {}).get("type") == "saved_chart_reference"
+        ))
+        configs = _fetch_saved_chart_configs(saved_chart_uuids)
+        for tile_info in result:
+            chart_configuration = tile_info.get("chart_configuration")
+            if chart_configuration and chart_configuration["type"] == "saved_chart_reference":
+                chart_configuration.update(configs[chart_configuration["savedChartUuid"]])
         
     return result
@@ -54,6 +54,20 @@ This is **essential before creating charts** to understand what fields exist and
     }
 )
 
+def _describe_field(field_key: str, field_data: dict[str, Any], table_key: str, prefix: str) -> dict[str, Any]:
+    """Project a dimension or metric definition onto the fields this tool returns"""
+    get = field_data.get
+    name = get("name", field_key)
+    return {
+        "name": name,
+        "fieldId": prefix + name,
+        "type": get("type", ""),
+        "label": get("label", ""),
+        "description": get("description", ""),
+        "hidden": get("hidden", False),
+        "table": get("table", table_key)
+    }
+
 def run(table_name: str, include_hidden: bool = False) -> dict[str, Any]:
     """Run the get explore schema tool"""
     project_uuid = get_project_uuid()
@@ -74,58 +88,40 @@ def run(table_name: str, include_hidden: bool = False) -> dict[str, Any]:
             "tables": {}
         }
         
+        total_dimensions = 0
+        total_metrics = 0
         for table_key, table_data in tables.items():
-            table_info = {
+            prefix = f"{table_key}_"
+            dimensions = [
+                _describe_field(dim_key, dim_data, table_key, prefix)
+                for dim_key, dim_data in table_data.get("dimensions", {}).items()
+                if include_hidden or not dim_data.get("hidden", False)
+            ]
+            metrics = []
+            for metric_key, metric_data in table_data.get("metrics", {}).items():
+                if include_hidden or not metric_data.get("hidden", False):
+                    metric_info = _describe_field(metric_key, metric_data, table_key, prefix)
+                    metric_info["sql"] = metric_data.get("sql", "")
+                    metrics.append(metric_info)
+            
+            result["tables"][table_key] = {
                 "name": table_data.get("name", table_key),
                 "label": table_data.get("label", ""),
                 "description": table_data.get("description", ""),
-                "dimensions": [],
-                "metrics": []
+                "dimensions": dimensions,
+                "metrics": metrics
             }
+            total_dimensions += len(dimensions)
+            total_metrics += len(metrics)
             
-            dimensions = table_data.get("dimensions", {})
-            for dim_key, dim_data in dimensions.items():
-                if not include_hidden and dim_data.get("hidden", False):
-                    continue
-                
-                table_info["dimensions"].append({
-                    "name": dim_data.get("name", dim_key),
-                    "fieldId": f"{table_key}_{dim_data.get('name', dim_key)}",
-                    "type": dim_data.get("type", ""),
-                    "label": dim_data.get("label", ""),
-                    "description": dim_data.get("description", ""),
-                    "hidden": dim_data.get("hidden", False),
-                    "table": dim_data.get("table", table_key)
-                })
-            
-            metrics = table_data.get("metrics", {})
-            for metric_key, metric_data in metrics.items():
-                if not include_hidden and metric_data.get("hidden", False):
-                    continue
-                
-                table_info["metrics"].append({
-                    "name": metric_data.get("name", metric_key),
-                    "fieldId": f"{table_key}_{metric_data.get('name', metric_key)}",
-                    "type": metric_data.get("type", ""),
-                    "label": metric_data.get("label", ""),
-                    "description": metric_data.get("description", ""),
-                    "hidden": metric_data.get("hidden", False),
-                    "table": metric_data.get("table", table_key),
-                    "sql": metric_data.get("sql", "")
-                })
-            
-            result["tables"][table_key] = table_info
-            
-        result["joins"] = []
-        for join in joins:
-            result["joins"].append({
+        result["joins"] = [
+            {
                 "table": join.get("table", ""),
                 "type": join.get("type", "left"),
                 "sqlOn": join.get("sqlOn", "")
-            })
-            
-        total_dimensions = sum(len(t["dimensions"]) for t in result["tables"].values())
-        total_metrics = sum(len(t["metrics"]) for t in result["tables"].values())
+            }
+            for join in joins
+        ]
         
         result["summary"] = {
             "totalTables": len(result["tables"]),
@@ -3,6 +3,7 @@ from typing import Any, Optional
 
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
+from .cache_utils import ttl_cache
 
 TOOL_DEFINITION = ToolDefinition(
     name="get-project",
@@ -28,6 +29,8 @@ Returns comprehensive project details including:
     }
 )
 
+# The default project practically never changes, and a str needs no defensive copy
+@ttl_cache(seconds=300, copy_result=False)
 def get_project_uuid() -> str:
     """Get project UUID from env var or default to the first project"""
     project_uuid = os.getenv("LIGHTDASH_PROJECT_UUID")
@@ -2,6 +2,7 @@ from typing import Any, Optional
 
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
+from .cache_utils import ttl_cache
 from .get_project import get_project_uuid
 
 TOOL_DEFINITION = ToolDefinition(
@@ -31,14 +32,55 @@ Returns chart information including:
     }
 )
 
-def run(search_term: Optional[str] = None) -> list[dict[str, Any]]:
-    """Run the list charts tool"""
-    project_uuid = get_project_uuid()
+@ttl_cache(seconds=30, copy_result=False)
+def _fetch_charts_raw(project_uuid: str) -> list[dict[str, Any]]:
+    """Fetch the project's full chart payload. Shared and cached, so treat it as read-only."""
     response = lightdash_client.get(f"/api/v1/projects/{project_uuid}/charts")
-    charts = response.get("results", [])
-    
+    return response.get("results", [])
+
+@ttl_cache(seconds=30, copy_result=False)
+def _chart_name_index(project_uuid: str) -> dict[str, tuple[str, str]]:
+    """Map each case-folded chart name to its (uuid, name); the first chart wins on duplicates"""
+    index: dict[str, tuple[str, str]] = {}
+    for chart in _fetch_charts_raw(project_uuid):
+        name = chart.get("name") or ""
+        index.setdefault(name.casefold(), (chart.get("uuid"), name))
+    return index
+
+@ttl_cache(seconds=30, copy_result=False)
+def chart_search_haystacks(project_uuid: str) -> list[tuple[str, str, dict[str, Any]]]:
+    """
+    Pair each raw chart with its case-folded name and case-folded "name\x00description"
+    text, so searches scan pre-folded strings. The NUL separator keeps a term from
+    matching across the name/description boundary. The list is shared: treat it as read-only.
+    """
+    haystacks = []
+    for chart in _fetch_charts_raw(project_uuid):
+        name = (chart.get("name") or "").casefold()
+        haystacks.append((name, f"{name}\x00{(chart.get('description') or '').casefold()}", chart))
+    return haystacks
+
+def find_chart(chart_name: str, project_uuid: Optional[str] = None) -> Optional[tuple[str, str]]:
+    """Look up a chart by case-insensitive exact name, returning (uuid, name) or None"""
+    if not project_uuid:
+        project_uuid = get_project_uuid()
+    return _chart_name_index(project_uuid).get(chart_name.casefold())
+
+def invalidate_chart_cache() -> None:
+    """Drop the cached chart payload after a chart is created, updated or deleted"""
+    _fetch_charts_raw.cache_clear()
+    _chart_name_index.cache_clear()
+    chart_search_haystacks.cache_clear()
+
+def run(search_term: Optional[str] = None, project_uuid: Optional[str] = None) -> list[dict[str, Any]]:
+    """Run the list charts tool"""
+    if not project_uuid:
+        project_uuid = get_project_uuid()
     if search_term:
-        charts = [c for c in charts if search_term.lower() in c.get("name", "").lower()]
+        needle = search_term.casefold()
+        charts = [chart for name, _, chart in chart_search_haystacks(project_uuid) if needle in name]
+    else:
+        charts = _fetch_charts_raw(project_uuid)
             
     result = []
     for chart in charts:
@@ -2,6 +2,7 @@ from typing import Any, Optional
 
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
+from .cache_utils import ttl_cache
 from .get_project import get_project_uuid
 
 TOOL_DEFINITION = ToolDefinition(
@@ -30,6 +31,7 @@ Returns dashboard metadata including:
     }
 )
 
+@ttl_cache(seconds=60)
 def run(project_uuid: Optional[str] = None) -> list[dict[str, Any]]:
     """Run the list dashboards tool"""
     if not project_uuid:
@@ -2,6 +2,7 @@ from typing import Any, Optional
 
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
+from .cache_utils import disk_cache, ttl_cache
 from .get_project import get_project_uuid
 
 TOOL_DEFINITION = ToolDefinition(
@@ -31,10 +32,18 @@ Returns a catalog of all tables/explores organized by project and dataset:
     }
 )
 
+# The catalog changes far less often than it is read, and can be large.
+# It is only ever serialized, never modified, so cache hits skip the deep copy.
+@ttl_cache(seconds=30, copy_result=False)
+@disk_cache("catalog", seconds=3600)
+def _fetch_catalog(project_uuid: str) -> dict[str, Any]:
+    """Fetch the project catalog. Shared and cached, so treat it as read-only."""
+    response = lightdash_client.get(f"/api/v1/projects/{project_uuid}/catalog")
+    return response.get("results", {})
+
 def run(project_uuid: Optional[str] = None) -> dict[str, Any]:
     """Run the list explores tool"""
     if not project_uuid:
         project_uuid = get_project_uuid()
     
-    response = lightdash_client.get(f"/api/v1/projects/{project_uuid}/catalog")
-    return response.get("results", {})
+    return _fetch_catalog(project_uuid)
@@ -2,6 +2,7 @@ from typing import Any
 
 from .. import lightdash_client
 from .base_tool import ToolDefinition
+from .cache_utils import ttl_cache
 
 TOOL_DEFINITION = ToolDefinition(
     name="list-projects",
@@ -19,6 +20,7 @@ Returns project information including:
     }
 )
 
+@ttl_cache(seconds=30)
 def run() -> list[dict[str, Any]]:
     """Run the list projects tool"""
     response = lightdash_client.get("/api/v1/org/projects")
@@ -36,14 +36,19 @@ def run() -> list[dict[str, Any]]:
     response = lightdash_client.get(f"/api/v1/projects/{project_uuid}/spaces")
     spaces = response.get("results", [])
     
-    result = []
-    for space in spaces:
-        result.append({
+    # The spaces listing carries summary counts; full space objects carry the
+    # item lists instead, so fall back to their lengths (no throwaway lists)
+    return [
+        {
             "uuid": space.get("uuid"),
             "name": space.get("name"),
             "isPrivate": space.get("isPrivate", False),
-            "chartCount": len(space.get("queries", [])),
-            "dashboardCount": len(space.get("dashboards", []))
-        })
-        
-    return result
+            "chartCount": (
+                space["chartCount"] if "chartCount" in space else len(space.get("queries") or ())
+            ),
+            "dashboardCount": (
+                space["dashboardCount"] if "dashboardCount" in space else len(space.get("dashboards") or ())
+            ),
+        }
+        for space in spaces
+    ]
@@ -1,8 +1,6 @@
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .get_dashboard_tiles import get_dashboard
-from .get_project import get_project_uuid
-from .list_dashboards import run as list_dashboards
+from .dashboard_utils import find_dashboard_uuid, find_tile_index, get_dashboard, get_dashboard_for_update, tile_title
 
 TOOL_DEFINITION = ToolDefinition(
     name="rename-dashboard-tile",
@@ -20,7 +18,7 @@ This is a convenience tool for the common operation of changing a tile's display
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching)"
+                description="Name of the dashboard (supports partial matching) or its UUID"
             ),
             "tile_identifier": ToolParameter(
                 type="string",
@@ -37,47 +35,25 @@ This is a convenience tool for the common operation of changing a tile's display
 
 def run(dashboard_name: str, tile_identifier: str, new_title: str) -> str:
     """Run the rename dashboard tile tool"""
-    project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-    
-    if not dashboard_uuid:
-        for dash in dashboards:
-            if dashboard_name.lower() in dash.get("name", "").lower():
-                dashboard_uuid = dash.get("uuid")
-                break
-    
+    dashboard_uuid = find_dashboard_uuid(dashboard_name)
     if not dashboard_uuid:
         raise ValueError(f"Dashboard '{dashboard_name}' not found")
 
-    dashboard = get_dashboard(dashboard_uuid)
+    dashboard = get_dashboard_for_update(dashboard_uuid)
     tiles = dashboard.get("tiles", [])
     
-    tile_found = False
-    old_title = ""
-    
-    for i, tile in enumerate(tiles):
-        props = tile.get("properties", {})
-        title = props.get("title", "") or props.get("chartName", "")
-        
-        if tile_identifier.lower() in title.lower():
-            tile_found = True
-            old_title = title
-            
-            if "title" in props or not props.get("chartName"):
-                tiles[i]["properties"]["title"] = new_title
-            else:
-                tiles[i]["properties"]["chartName"] = new_title
-            break
-            
-    if not tile_found:
+    tile_index = find_tile_index(tiles, tile_identifier)
+    if tile_index is None:
         raise ValueError(f"Tile matching '{tile_identifier}' not found on dashboard '{dashboard_name}'")
 
+    tile = tiles[tile_index]
+    old_title = tile_title(tile)
+    props = tile["properties"]
+    if "title" in props or not props.get("chartName"):
+        props["title"] = new_title
+    else:
+        props["chartName"] = new_title
+
     update_payload = {
         "name": dashboard.get("name"),
         "tiles": tiles,
@@ -86,5 +62,6 @@ def run(dashboard_name: str, tile_identifier: str, new_title: str) -> str:
     }
     
     lightdash_client.patch(f"/api/v1/dashboards/{dashboard_uuid}", data=update_payload)
+    get_dashboard.invalidate(dashboard_uuid)
     
     return f"Successfully renamed tile from '{old_title}' to '{new_title}' on dashboard '{dashboard_name}'"
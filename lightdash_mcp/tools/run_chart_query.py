@@ -1,8 +1,10 @@
-from typing import Any
+from itertools import islice
+from typing import Any, Optional
 
 from .. import lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .utils import flatten_rows, format_as_csv
+from .cache_utils import ttl_cache
+from .utils import format_as_csv, iter_flat_rows
 
 TOOL_DEFINITION = ToolDefinition(
     name="run-chart-query",
@@ -24,6 +26,7 @@ Runs the chart's configured query against the data warehouse and returns the res
 - Large result sets may take time to execute
 - Use the `limit` parameter to restrict rows returned
 - Query execution happens in real-time against your warehouse
+- Results are reused for 60 seconds for the same chart and limit; pass `force_refresh` to re-run
 
 **Optional limit parameter:** Restricts the number of rows returned (useful for large datasets)""",
     inputSchema={
@@ -35,17 +38,21 @@ Runs the chart's configured query against the data warehouse and returns the res
             "limit": ToolParameter(
                 type="number",
                 description="Optional: Limit number of rows returned. Useful for large datasets. Example: 100 will return max 100 rows"
+            ),
+            "force_refresh": ToolParameter(
+                type="boolean",
+                description="Optional: If true, re-run the query instead of reusing a result from the last 60 seconds. Default: false"
             )
         },
         "required": ["chart_uuid"]
     }
 )
 
-def run(chart_uuid: str, limit: int = None) -> str:
-    """Run the run chart query tool"""
-    # We no longer verify if the chart exists in the project list to save an API call.
-    # The API will return a 404 if the chart UUID is invalid.
-        
+# Warehouse queries are the slowest calls an agent makes and are often repeated
+# within a conversation; the CSV result is an immutable str, so share it as-is
+@ttl_cache(seconds=60, copy_result=False, maxsize=64)
+def _chart_results_csv(chart_uuid: str, limit: Optional[int]) -> str:
+    """Execute a saved chart's query and format the results as CSV"""
     url = f"/api/v1/saved/{chart_uuid}/results"
     
     payload = {}
@@ -56,10 +63,27 @@ def run(chart_uuid: str, limit: int = None) -> str:
     query_results = response.get("results", {})
     
     rows = query_results.get("rows", [])
-    if limit is not None and isinstance(rows, list) and len(rows) > limit:
-        rows = rows[:limit]
     
-    flattened_rows = flatten_rows(rows)
-    metadata = {"row_count": len(flattened_rows)}
+    # Flattening keeps one dict per row, so the count is known up front and the
+    # flattened rows can stream straight into the CSV writer. If the server
+    # ignored the limit, islice stops flattening at `limit` rows.
+    flat_rows = iter_flat_rows(rows)
+    row_count = len(rows)
+    if limit is not None and row_count > limit:
+        flat_rows = islice(flat_rows, limit)
+        row_count = limit
+    metadata = {"row_count": row_count}
     
-    return format_as_csv(flattened_rows, metadata)
+    return format_as_csv(flat_rows, metadata)
+
+def invalidate_chart_results() -> None:
+    """Drop cached query results after a chart is changed or deleted"""
+    _chart_results_csv.cache_clear()
+
+def run(chart_uuid: str, limit: int = None, force_refresh: bool = False) -> str:
+    """Run the run chart query tool"""
+    # We no longer verify if the chart exists in the project list to save an API call.
+    # The API will return a 404 if the chart UUID is invalid.
+    if force_refresh:
+        _chart_results_csv.invalidate(chart_uuid, limit)
+    return _chart_results_csv(chart_uuid, limit)
@@ -1,8 +1,11 @@
+import os
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional
 
 from .base_tool import ToolDefinition, ToolParameter
-from .dashboard_utils import get_dashboard_by_name, execute_dashboard_tile
+from .dashboard_utils import get_dashboard_by_name, execute_dashboard_tile, tile_title
+from .get_project import get_project_uuid
 from .utils import format_as_csv
 
 TOOL_DEFINITION = ToolDefinition(
@@ -28,7 +31,7 @@ This tool fetches the dashboard configuration once and then executes the selecte
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching)"
+                description="Name of the dashboard (supports partial matching) or its UUID"
             ),
             "tile_uuids": ToolParameter(
                 type="array",
@@ -40,6 +43,29 @@ This tool fetches the dashboard configuration once and then executes the selecte
     }
 )
 
+# Upper bound on concurrent tile queries, to avoid overwhelming the API or warehouse.
+# Workers mostly sleep while polling async query results, so threads are cheap here;
+# the default stays well under the HTTP connection pool size (32).
+_DEFAULT_TILE_WORKERS = 10
+
+def _max_tile_workers() -> int:
+    """Read LIGHTDASH_TILE_CONCURRENCY, falling back to the default on a missing or invalid value"""
+    value = os.getenv("LIGHTDASH_TILE_CONCURRENCY")
+    if not value:
+        return _DEFAULT_TILE_WORKERS
+    try:
+        return max(1, int(value))
+    except ValueError:
+        print(
+            f"[run-dashboard-tiles] Ignoring invalid LIGHTDASH_TILE_CONCURRENCY={value!r}, using {_DEFAULT_TILE_WORKERS}",
+            file=sys.stderr,
+        )
+        return _DEFAULT_TILE_WORKERS
+
+_MAX_TILE_WORKERS = _max_tile_workers()
+
+_CHART_TILE_TYPES = frozenset(("saved_chart", "chart", "sql_chart"))
+
 def run(dashboard_name: str, tile_uuids: Optional[List[str]] = None) -> Dict[str, Any]:
     """Run multiple dashboard tiles concurrently"""
     
@@ -54,55 +80,50 @@ def run(dashboard_name: str, tile_uuids: Optional[List[str]] = None) -> Dict[str
     all_tiles = dashboard.get("tiles", [])
     
     # 2. Filter tiles to execute
-    tiles_to_run = []
     if tile_uuids:
-        # Create a map for O(1) lookup
+        # Create a set for O(1) lookup
         target_uuids = set(tile_uuids)
-        for tile in all_tiles:
-            if tile.get("uuid") in target_uuids:
-                tiles_to_run.append(tile)
+        tiles_to_run = [tile for tile in all_tiles if tile.get("uuid") in target_uuids]
     else:
         # Run all chart tiles (saved_chart, chart, or sql_chart)
-        for tile in all_tiles:
-            if tile.get("type") in ["saved_chart", "chart", "sql_chart"]:
-                tiles_to_run.append(tile)
+        tiles_to_run = [tile for tile in all_tiles if tile.get("type") in _CHART_TILE_TYPES]
                 
     if not tiles_to_run:
         return {"results": {}, "message": "No matching chart tiles found to execute."}
     
     results = {}
+    project_uuid = get_project_uuid()
     
-    # 3. Execute in parallel
-    # Limit max_workers to avoid overwhelming the API or Warehouse
-    with ThreadPoolExecutor(max_workers=5) as executor:
+    # 3. Execute in parallel, never starting more threads than there are tiles
+    with ThreadPoolExecutor(max_workers=min(_MAX_TILE_WORKERS, len(tiles_to_run))) as executor:
         future_to_tile = {
-            executor.submit(execute_dashboard_tile, tile, dashboard_filters, dashboard_uuid): tile 
+            executor.submit(execute_dashboard_tile, tile, dashboard_filters, dashboard_uuid, project_uuid): tile 
             for tile in tiles_to_run
         }
         
         for future in as_completed(future_to_tile):
             tile = future_to_tile[future]
             tile_uuid = tile.get("uuid")
-            tile_title = tile.get("properties", {}).get("title") or tile.get("properties", {}).get("chartName") or "Untitled"
+            title = tile_title(tile) or "Untitled"
             
             try:
                 data = future.result()
                 # Convert rows to CSV format
-                rows = data.get("rows", [])
+                rows = data.get("rows", ())
                 metadata = {
-                    "row_count": data.get("row_count", len(rows)),
+                    "row_count": data["row_count"],
                     "fields": data.get("fields", {})
                 }
                 csv_data = format_as_csv(rows, metadata)
                 
                 results[tile_uuid] = {
-                    "title": tile_title,
+                    "title": title,
                     "status": "success",
                     "csv_data": csv_data
                 }
             except Exception as e:
                 results[tile_uuid] = {
-                    "title": tile_title,
+                    "title": title,
                     "status": "error",
                     "error": str(e)
                 }
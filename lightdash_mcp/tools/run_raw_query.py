@@ -1,10 +1,9 @@
 from typing import Any, Dict, Optional, Union
-import json
 
-from .. import lightdash_client
+from .. import json_utils, lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
 from .get_project import get_project_uuid
-from .utils import flatten_rows, format_as_csv
+from .utils import format_as_csv, iter_flat_rows
 
 TOOL_DEFINITION = ToolDefinition(
     name="run-raw-query",
@@ -96,51 +95,54 @@ metric_query:
     }
 )
 
-def run(explore_name: str, metric_query: Union[str, Dict[str, Any]], limit: Optional[int] = 500) -> str:
-    """Run the run raw query tool"""
-    project_uuid = get_project_uuid()
-    
-    # Parse metric_query if it's a string
-    if isinstance(metric_query, str):
-        try:
-            query_config = json.loads(metric_query)
-        except json.JSONDecodeError:
-            raise ValueError("metric_query must be a valid JSON string")
-    else:
-        query_config = metric_query
-
-    # Ensure limit is set
-    if limit:
-        query_config['limit'] = limit
+def execute_metric_query(explore_name: str, query_config: Dict[str, Any], limit: Optional[int] = 500, project_uuid: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a metric query against an explore and return its flattened rows, row_count and fields.
+    "rows" is a single-use iterator, flattened lazily as the caller consumes it.
+    query_config is not mutated; the API-required defaults are added to a shallow copy.
+    """
+    if not project_uuid:
+        project_uuid = get_project_uuid()
 
-    # Ensure required fields are present to avoid 422 errors
     # The API requires 'exploreName', 'sorts', and 'tableCalculations' even if empty
-    query_config['exploreName'] = explore_name
-    if 'sorts' not in query_config:
-        query_config['sorts'] = []
-    if 'tableCalculations' not in query_config:
-        query_config['tableCalculations'] = []
-    if 'dimensions' not in query_config:
-        query_config['dimensions'] = []
-    if 'metrics' not in query_config:
-        query_config['metrics'] = []
+    payload = {"sorts": [], "tableCalculations": [], "dimensions": [], "metrics": [], **query_config}
+    payload["exploreName"] = explore_name
+    if limit:
+        payload["limit"] = limit
 
     url = f"/api/v1/projects/{project_uuid}/explores/{explore_name}/runQuery"
     
     try:
-        response = lightdash_client.post(url, data=query_config)
+        response = lightdash_client.post(url, data=payload)
     except Exception as e:
         error_msg = str(e)
         if "No function has been implemented to render SQL" in error_msg and "date" in error_msg:
             raise Exception(f"{error_msg}\n\n💡 TIP: The 'inTheYear' or similar complex date operators may not be supported for this field type. Try using explicit date range filters instead (greaterThanOrEqual and lessThanOrEqual).") from e
         raise e
 
-    results = response.get("results", {})
-    
-    flattened_rows = flatten_rows(results.get("rows", []))
-    metadata = {
-        "row_count": len(flattened_rows),
+    results = response.get("results") or {}
+    rows = results.get("rows", ())
+    return {
+        "rows": iter_flat_rows(rows),
+        "row_count": len(rows),
         "fields": results.get("fields", {})
     }
+
+def run(explore_name: str, metric_query: Union[str, Dict[str, Any]], limit: Optional[int] = 500, project_uuid: Optional[str] = None) -> str:
+    """Run the run raw query tool"""
+    # Parse metric_query if it's a string
+    if isinstance(metric_query, str):
+        try:
+            query_config = json_utils.loads(metric_query)
+        except json_utils.JSONDecodeError:
+            raise ValueError("metric_query must be a valid JSON string")
+    else:
+        query_config = metric_query
+
+    data = execute_metric_query(explore_name, query_config, limit, project_uuid)
+    metadata = {
+        "row_count": data["row_count"],
+        "fields": data["fields"]
+    }
     
-    return format_as_csv(flattened_rows, metadata)
+    return format_as_csv(data["rows"], metadata)
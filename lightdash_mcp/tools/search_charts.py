@@ -1,7 +1,8 @@
 from typing import Any
 
 from .base_tool import ToolDefinition, ToolParameter
-from .list_charts import run as list_charts
+from .get_project import get_project_uuid
+from .list_charts import chart_search_haystacks
 
 TOOL_DEFINITION = ToolDefinition(
     name="search-charts",
@@ -32,13 +33,11 @@ Returns matching charts with their UUID, name, space, and description.
 
 def run(search_term: str) -> list[dict[str, Any]]:
     """Run the search charts tool"""
-    charts = list_charts()
+    needle = search_term.casefold()
     
     results = []
-    for chart in charts:
-        name = chart.get("name", "").lower()
-        desc = chart.get("description", "").lower()
-        if search_term.lower() in name or search_term.lower() in desc:
+    for _, haystack, chart in chart_search_haystacks(get_project_uuid()):
+        if needle in haystack:
             results.append({
                 "uuid": chart.get("uuid"),
                 "name": chart.get("name"),
@@ -1,10 +1,11 @@
-import json
 from typing import Any
 
-from .. import lightdash_client
+from .. import json_utils, lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .get_chart_details import get_chart as get_chart_details, _looks_like_uuid
-from .list_charts import run as list_charts
+from .get_chart_details import get_chart as get_chart_details
+from .list_charts import find_chart, invalidate_chart_cache
+from .run_chart_query import invalidate_chart_results
+from .utils import normalize_uuid
 
 TOOL_DEFINITION = ToolDefinition(
     name="update-chart",
@@ -80,13 +81,20 @@ def deep_merge(base: dict, updates: dict) -> dict:
     """
     Deep merge updates into base dict.
     For lists, replaces entirely (doesn't merge list items).
+    Walks an explicit stack instead of recursing; only dicts on an updated
+    path are copied, untouched subtrees are shared with base.
     """
-    result = base.copy()
-    for key, value in updates.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    result = dict(base)
+    stack = [(result, updates)]
+    while stack:
+        target, changes = stack.pop()
+        for key, value in changes.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = dict(current)
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     return result
 
 
@@ -103,18 +111,13 @@ def run(
     # Find the chart. A UUID may be a chart saved *within a dashboard* — absent from
     # list-charts (Space catalog only). Resolve it directly, mirroring get-chart-details;
     # the version endpoint (/api/v1/saved/{uuid}/version) accepts dashboard-owned charts.
-    chart_uuid = None
     chart_name = ""
-    if _looks_like_uuid(chart_identifier):
-        chart_uuid = chart_identifier
-    else:
-        for chart in list_charts():
-            if chart.get("name", "").lower() == chart_identifier.lower():
-                chart_uuid = chart.get("uuid")
-                chart_name = chart.get("name", "")
-                break
-        if not chart_uuid:
+    chart_uuid = normalize_uuid(chart_identifier)
+    if not chart_uuid:
+        match = find_chart(chart_identifier)
+        if not match:
             raise ValueError(f"Chart '{chart_identifier}' not found. Use list-charts to see available charts.")
+        chart_uuid, chart_name = match
 
     # Get current chart config for reference and as base for updates
     current_chart = get_chart_details(chart_uuid)
@@ -122,12 +125,15 @@ def run(
         chart_name = current_chart.get("name", "")
     
     # Build version payload - start with current values
-    base_metric_query = current_chart.get("metricQuery", {}).copy()
-    # Remove fields that shouldn't be in the update
-    base_metric_query.pop("metricOverrides", None)
-    # Remove uuid from additionalMetrics as it's auto-generated
-    for am in base_metric_query.get("additionalMetrics", []):
-        am.pop("uuid", None)
+    # Project into fresh dicts rather than popping from the fetched chart, so
+    # nothing shared with the caller (or a cache) is mutated:
+    # - metricOverrides shouldn't be in the update
+    # - additionalMetrics uuids are auto-generated
+    base_metric_query = {k: v for k, v in current_chart.get("metricQuery", {}).items() if k != "metricOverrides"}
+    if "additionalMetrics" in base_metric_query:
+        base_metric_query["additionalMetrics"] = [
+            {k: v for k, v in am.items() if k != "uuid"} for am in base_metric_query["additionalMetrics"]
+        ]
     
     version_data: dict[str, Any] = {
         "tableName": current_chart.get("tableName"),
@@ -153,23 +159,23 @@ def run(
     
     if metric_query:
         try:
-            metric_query_updates = json.loads(metric_query)
+            metric_query_updates = json_utils.loads(metric_query)
             # Merge with already-cleaned base_metric_query
             merged_metric_query = deep_merge(base_metric_query, metric_query_updates)
             version_data["metricQuery"] = merged_metric_query
             updated_fields.append(f"metricQuery ({', '.join(metric_query_updates.keys())})")
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
             return f"Error parsing metric_query JSON: {str(e)}"
     
     if chart_config:
         try:
-            chart_config_updates = json.loads(chart_config)
+            chart_config_updates = json_utils.loads(chart_config)
             # Merge with existing chartConfig
             current_chart_config = current_chart.get("chartConfig", {})
             merged_chart_config = deep_merge(current_chart_config, chart_config_updates)
             version_data["chartConfig"] = merged_chart_config
             updated_fields.append("chartConfig")
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
             return f"Error parsing chart_config JSON: {str(e)}"
     
     if pivot_config:
@@ -178,10 +184,10 @@ def run(
                 version_data["pivotConfig"] = None
                 updated_fields.append("pivotConfig (removed)")
             else:
-                pivot_config_data = json.loads(pivot_config)
+                pivot_config_data = json_utils.loads(pivot_config)
                 version_data["pivotConfig"] = pivot_config_data
                 updated_fields.append("pivotConfig")
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
             return f"Error parsing pivot_config JSON: {str(e)}"
     
     if not updated_fields:
@@ -190,6 +196,9 @@ def run(
     # Create new version using POST endpoint
     try:
         result = lightdash_client.post(f"/api/v1/saved/{chart_uuid}/version", data=version_data)
+        get_chart_details.invalidate(chart_uuid)
+        invalidate_chart_cache()
+        invalidate_chart_results()
         
         return f"✅ Successfully updated chart '{chart_name}' (UUID: {chart_uuid})\n\nUpdated fields: {', '.join(updated_fields)}"
     
@@ -1,10 +1,8 @@
-import json
+from typing import Any
 
-from .. import lightdash_client
+from .. import json_utils, lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .get_dashboard_tiles import get_dashboard
-from .get_project import get_project_uuid
-from .list_dashboards import run as list_dashboards
+from .dashboard_utils import find_dashboard_uuid, get_dashboard, get_dashboard_for_update, invalidate_dashboard_cache
 
 TOOL_DEFINITION = ToolDefinition(
     name="update-dashboard-filters",
@@ -18,7 +16,7 @@ Dashboard filters allow users to:
 **Filter configuration structure:**
 Filters use the same structure as chart filters with:
 - Field references (fieldId)
-- Operators (equals, notEquals, contains, greaterThan, etc.)
+- Operators (equals, notEquals, include, greaterThan, etc.)
 - Values or value ranges
 - Time-based filters (inThePast, inTheNext, etc.)
 
@@ -35,7 +33,7 @@ Filters use the same structure as chart filters with:
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching)"
+                description="Name of the dashboard (supports partial matching) or its UUID"
             ),
             "filters": ToolParameter(
                 type="string",
@@ -46,34 +44,89 @@ Filters use the same structure as chart filters with:
     }
 )
 
+# Generous bounds for real filter trees (each nested and/or group adds two levels);
+# anything beyond is a mistake worth rejecting before any network round trip
+_MAX_FILTERS_LENGTH = 256 * 1024
+_MAX_FILTERS_DEPTH = 32
+
+def _nesting_depth(value: Any) -> int:
+    """Deepest dict/list nesting in a parsed JSON value, walked iteratively"""
+    max_depth = 0
+    stack = [(value, 1)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, dict):
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        max_depth = max(max_depth, depth)
+        stack.extend((child, depth + 1) for child in children)
+    return max_depth
+
+# Lightdash's FilterOperator values; anything else is rejected by the API after a round trip
+_FILTER_OPERATORS = frozenset((
+    "isNull", "notNull", "equals", "notEquals", "startsWith", "endsWith",
+    "include", "doesNotInclude", "lessThan", "lessThanOrEqual", "greaterThan",
+    "greaterThanOrEqual", "inThePast", "notInThePast", "inTheNext", "inTheCurrent",
+    "notInTheCurrent", "inBetween", "notInBetween",
+))
+
+def _invalid_operators(value: Any) -> list[str]:
+    """Operators in a parsed filter tree that Lightdash does not recognise, in order of appearance"""
+    invalid = []
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            operator = node.get("operator")
+            if operator is not None and operator not in _FILTER_OPERATORS:
+                invalid.append(str(operator))
+            stack.extend(reversed(node.values()))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return list(dict.fromkeys(invalid))
+
 def run(dashboard_name: str, filters: str) -> str:
     """Run the update dashboard filters tool"""
+    if len(filters) > _MAX_FILTERS_LENGTH:
+        return f"Error: filters JSON is too large ({len(filters)} characters, limit {_MAX_FILTERS_LENGTH})"
     try:
-        filters_data = json.loads(filters)
-    except json.JSONDecodeError as e:
+        filters_data = json_utils.loads(filters)
+    except json_utils.JSONDecodeError as e:
         return f"Error parsing filters JSON: {str(e)}"
+    if not isinstance(filters_data, dict):
+        return "Error: filters must be a JSON object with 'dimensions' and/or 'metrics' keys"
+    if _nesting_depth(filters_data) > _MAX_FILTERS_DEPTH:
+        return f"Error: filters JSON is nested more than {_MAX_FILTERS_DEPTH} levels deep"
+    if invalid_operators := _invalid_operators(filters_data):
+        return f"Error: unknown filter operator(s) {invalid_operators}. Valid operators: {sorted(_FILTER_OPERATORS)}"
 
-    project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-            
+    dashboard_uuid = find_dashboard_uuid(dashboard_name)
     if not dashboard_uuid:
         raise ValueError(f"Dashboard '{dashboard_name}' not found")
         
-    dashboard = get_dashboard(dashboard_uuid)
-    
-    update_payload = {
-        "name": dashboard.get("name"),
-        "tiles": dashboard.get("tiles", []),
-        "filters": filters_data,
-        "tabs": dashboard.get("tabs", [])
-    }
-    
-    lightdash_client.patch(f"/api/v1/dashboards/{dashboard_uuid}", data=update_payload)
+    try:
+        dashboard = get_dashboard_for_update(dashboard_uuid)
+        # Dict equality is deep and key-order independent, so a resubmitted
+        # filter set needs no PATCH (and no new dashboard version)
+        if dashboard.get("filters") == filters_data:
+            return f"Filters on dashboard '{dashboard_name}' are already up to date"
+
+        update_payload = {
+            "name": dashboard.get("name"),
+            "tiles": dashboard.get("tiles", []),
+            "filters": filters_data,
+            "tabs": dashboard.get("tabs", [])
+        }
+
+        lightdash_client.patch(f"/api/v1/dashboards/{dashboard_uuid}", data=update_payload)
+    except Exception:
+        # The cached listing may point at a dashboard that was renamed or deleted
+        # elsewhere; drop it so the next call resolves the name afresh
+        invalidate_dashboard_cache()
+        raise
+    get_dashboard.invalidate(dashboard_uuid)
     
     return f"Successfully updated filters on dashboard '{dashboard_name}'"
@@ -1,10 +1,6 @@
-import json
-
-from .. import lightdash_client
+from .. import json_utils, lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
-from .get_dashboard_tiles import get_dashboard
-from .get_project import get_project_uuid
-from .list_dashboards import run as list_dashboards
+from .dashboard_utils import find_dashboard_uuid, find_tile_index, get_dashboard, get_dashboard_for_update
 
 TOOL_DEFINITION = ToolDefinition(
     name="update-dashboard-tile",
@@ -42,7 +38,7 @@ Lightdash uses a **36-column grid** horizontally:
         "properties": {
             "dashboard_name": ToolParameter(
                 type="string",
-                description="Name of the dashboard (supports partial matching)"
+                description="Name of the dashboard (supports partial matching) or its UUID"
             ),
             "tile_identifier": ToolParameter(
                 type="string",
@@ -57,54 +53,34 @@ Lightdash uses a **36-column grid** horizontally:
     }
 )
 
+_POSITION_PROPS = frozenset(("x", "y", "h", "w"))
+
 def run(dashboard_name: str, tile_identifier: str, properties_update: str) -> str:
     """Run the update dashboard tile tool"""
     try:
-        properties_update_data = json.loads(properties_update)
-    except json.JSONDecodeError as e:
+        properties_update_data = json_utils.loads(properties_update)
+    except json_utils.JSONDecodeError as e:
         return f"Error parsing properties_update JSON: {str(e)}"
 
-    project_uuid = get_project_uuid()
-    dashboards = list_dashboards(project_uuid)
-    
-    dashboard_uuid = None
-    for dash in dashboards:
-        if dash.get("name", "").lower() == dashboard_name.lower():
-            dashboard_uuid = dash.get("uuid")
-            break
-    
-    if not dashboard_uuid:
-        for dash in dashboards:
-            if dashboard_name.lower() in dash.get("name", "").lower():
-                dashboard_uuid = dash.get("uuid")
-                break
-    
+    dashboard_uuid = find_dashboard_uuid(dashboard_name)
     if not dashboard_uuid:
         raise ValueError(f"Dashboard '{dashboard_name}' not found")
 
-    dashboard = get_dashboard(dashboard_uuid)
+    dashboard = get_dashboard_for_update(dashboard_uuid)
     tiles = dashboard.get("tiles", [])
     
-    tile_found = False
+    # Split the update once: grid position lives on the tile, everything else in its properties
+    position_updates = {k: v for k, v in properties_update_data.items() if k in _POSITION_PROPS}
+    property_updates = {k: v for k, v in properties_update_data.items() if k not in _POSITION_PROPS}
     
-    for i, tile in enumerate(tiles):
-        props = tile.get("properties", {})
-        title = props.get("title", "") or props.get("chartName", "")
-        
-        if tile_identifier.lower() in title.lower():
-            tile_found = True
-            
-            position_props = {"x", "y", "h", "w"}
-            for key, value in properties_update_data.items():
-                if key in position_props:
-                    tiles[i][key] = value
-                else:
-                    tiles[i]["properties"][key] = value
-            break
-            
-    if not tile_found:
+    tile_index = find_tile_index(tiles, tile_identifier)
+    if tile_index is None:
         raise ValueError(f"Tile matching '{tile_identifier}' not found on dashboard '{dashboard_name}'")
 
+    tile = tiles[tile_index]
+    tile.update(position_updates)
+    tile.setdefault("properties", {}).update(property_updates)
+
     update_payload = {
         "name": dashboard.get("name"),
         "tiles": tiles,
@@ -113,5 +89,6 @@ def run(dashboard_name: str, tile_identifier: str, properties_update: str) -> st
     }
     
     lightdash_client.patch(f"/api/v1/dashboards/{dashboard_uuid}", data=update_payload)
+    get_dashboard.invalidate(dashboard_uuid)
     
-    return f"Successfully updated tile '{tile_identifier}' on dashboard '{dashboard_name}' with properties: {json.dumps(properties_update_data)}"
+    return f"Successfully updated tile '{tile_identifier}' on dashboard '{dashboard_name}' with properties: {json_utils.dumps(properties_update_data)}"
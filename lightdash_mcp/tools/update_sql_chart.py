@@ -1,7 +1,6 @@
-import json
 from typing import Any
 
-from .. import lightdash_client
+from .. import json_utils, lightdash_client
 from .base_tool import ToolDefinition, ToolParameter
 from .get_project import get_project_uuid
 from .get_sql_chart import get_sql_chart
@@ -94,9 +93,9 @@ def run(
 
     if config:
         try:
-            versioned["config"] = json.loads(config)
+            versioned["config"] = json_utils.loads(config)
             changed.append("config")
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
             return f"❌ config is not valid JSON: {e}"
 
     if limit not in ("", None):
@@ -1,52 +1,94 @@
 import csv
-import json
+import operator
+import uuid
 from io import StringIO
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
-def flatten_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+from .. import json_utils
+
+def normalize_uuid(value: str) -> Optional[str]:
+    """
+    Canonical lowercase hyphenated form of value if it parses as a UUID (bare hex,
+    braced and urn:uuid: forms included), else None. Use the returned string in URLs.
+    """
+    try:
+        return str(uuid.UUID(str(value)))
+    except (ValueError, AttributeError, TypeError):
+        return None
+
+def iter_flat_rows(rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
     """
-    Flattens Lightdash query results from:
+    Lazily flattens Lightdash query results from:
     [{"field_id": {"value": {"raw": 123, "formatted": "123"}}}]
     to:
     [{"field_id": 123}]
     """
-    flattened = []
     for row in rows:
         flat_row = {}
         for key, value in row.items():
-            if isinstance(value, dict) and "value" in value and "raw" in value["value"]:
-                flat_row[key] = value["value"]["raw"]
-            else:
-                flat_row[key] = value
-        flattened.append(flat_row)
-    return flattened
+            # Lightdash cells are nearly always {"value": {"raw": ...}}, so try the
+            # lookup directly instead of testing each level first
+            if type(value) is dict:
+                try:
+                    flat_row[key] = value["value"]["raw"]
+                    continue
+                except (KeyError, TypeError):
+                    pass
+            flat_row[key] = value
+        yield flat_row
 
-def format_as_csv(rows: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> str:
+def flatten_rows(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flattens Lightdash query results (any iterable, e.g. an islice) into a list (see iter_flat_rows)"""
+    return list(iter_flat_rows(rows))
+
+def format_as_csv(rows: Iterable[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> str:
     """
     Formats query results as CSV string.
     
     Args:
-        rows: List of dictionaries (query results)
+        rows: List or iterator of dictionaries (query results); consumed in a single pass
         metadata: Optional metadata to include as JSON comment at top
         
     Returns:
         CSV-formatted string with optional metadata header
     """
-    if not rows:
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
         if metadata:
-            return f"# Metadata: {json.dumps(metadata, separators=(',', ':'))}\n# No data rows\n"
+            return f"# Metadata: {json_utils.dumps(metadata)}\n# No data rows\n"
         return "# No data rows\n"
     
     output = StringIO()
     
     # Add metadata as comment if provided
     if metadata:
-        output.write(f"# Metadata: {json.dumps(metadata, separators=(',', ':'))}\n")
+        output.write(f"# Metadata: {json_utils.dumps(metadata)}\n")
     
-    # Write CSV data
-    fieldnames = list(rows[0].keys())
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(rows)
+    # Write CSV data. Rows of one result set normally share the same columns, so pull
+    # values in header order with a single itemgetter call; rows with different keys
+    # get DictWriter's semantics (missing -> empty cell, extra -> ValueError).
+    fieldnames = list(first_row.keys())
+    width = len(fieldnames)
+    field_set = frozenset(fieldnames)
+    # itemgetter needs at least one key; an empty first row takes the generic path
+    pick = operator.itemgetter(*fieldnames) if width else None
+
+    def row_values(row: Dict[str, Any]) -> Iterable[Any]:
+        if pick is not None and len(row) == width:
+            try:
+                values = pick(row)
+                return (values,) if width == 1 else values
+            except KeyError:
+                pass
+        extra = row.keys() - field_set
+        if extra:
+            raise ValueError("dict contains fields not in fieldnames: " + ", ".join(map(repr, extra)))
+        return [row.get(field, "") for field in fieldnames]
+
+    writer = csv.writer(output)
+    writer.writerow(fieldnames)
+    writer.writerow(row_values(first_row))
+    writer.writerows(map(row_values, rows))
     
     return output.getvalue()
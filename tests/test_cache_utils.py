@@ -0,0 +1,87 @@
+import unittest
+from unittest import mock
+
+from lightdash_mcp.tools import cache_utils
+from lightdash_mcp.tools.cache_utils import ttl_cache
+
+
+class TtlCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(cache_utils.time, "monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_results_are_reused_until_expiry(self):
+        calls = []
+
+        @ttl_cache(seconds=10)
+        def fetch(key):
+            calls.append(key)
+            return {"key": key}
+
+        fetch("a")
+        fetch("a")
+        self.assertEqual(calls, ["a"])
+        self.now += 11
+        fetch("a")
+        self.assertEqual(calls, ["a", "a"])
+
+    def test_returns_deep_copies_by_default(self):
+        @ttl_cache(seconds=10)
+        def fetch():
+            return {"items": [1]}
+
+        fetch()["items"].append(2)
+        self.assertEqual(fetch(), {"items": [1]})
+
+    def test_copy_result_false_shares_the_value(self):
+        @ttl_cache(seconds=10, copy_result=False)
+        def fetch():
+            return {"items": [1]}
+
+        self.assertIs(fetch(), fetch())
+
+    def test_invalidate_and_cache_clear(self):
+        calls = []
+
+        @ttl_cache(seconds=10)
+        def fetch(key):
+            calls.append(key)
+            return key
+
+        fetch("a")
+        fetch("b")
+        fetch.invalidate("a")
+        fetch("a")
+        fetch("b")
+        self.assertEqual(calls, ["a", "b", "a"])
+        fetch.cache_clear()
+        fetch("b")
+        self.assertEqual(calls, ["a", "b", "a", "b"])
+
+    def test_maxsize_evicts_oldest_and_drops_expired(self):
+        calls = []
+
+        @ttl_cache(seconds=10, maxsize=2)
+        def fetch(key):
+            calls.append(key)
+            return key
+
+        fetch("a")
+        self.now += 5
+        fetch("b")
+        fetch("c")  # full: evicts the oldest entry, "a"
+        fetch("b")
+        fetch("a")
+        self.assertEqual(calls, ["a", "b", "c", "a"])
+
+        self.now += 11  # "c" and "a" expired: purged on the next insert, not served
+        calls.clear()
+        fetch("d")
+        fetch("c")
+        self.assertEqual(calls, ["d", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
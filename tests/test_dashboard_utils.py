@@ -0,0 +1,80 @@
+import unittest
+from unittest import mock
+
+from lightdash_mcp.tools import dashboard_utils
+from lightdash_mcp.tools.dashboard_utils import _merge_filters, find_dashboard_uuid
+
+DASHBOARDS = [
+    {"uuid": "u-overview", "name": "Sales Overview"},
+    {"uuid": "u-weekly", "name": "Weekly Sales"},
+    {"uuid": "u-sales", "name": "Sales"},
+    {"uuid": "u-straße", "name": "Straße KPIs"},
+]
+
+
+class FindDashboardUuidTest(unittest.TestCase):
+    def setUp(self):
+        dashboard_utils._dashboard_index.cache_clear()
+        self.addCleanup(dashboard_utils._dashboard_index.cache_clear)
+        patcher = mock.patch.object(dashboard_utils, "list_dashboards", return_value=DASHBOARDS)
+        self.list_dashboards = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_exact_match_beats_prefix_and_substring(self):
+        self.assertEqual(find_dashboard_uuid("sales", "p"), "u-sales")
+
+    def test_prefix_match_beats_substring(self):
+        self.assertEqual(find_dashboard_uuid("sales o", "p"), "u-overview")
+        self.assertEqual(find_dashboard_uuid("SALES OV", "p"), "u-overview")
+
+    def test_substring_match(self):
+        self.assertEqual(find_dashboard_uuid("weekly", "p"), "u-weekly")
+        self.assertEqual(find_dashboard_uuid("ly sal", "p"), "u-weekly")
+
+    def test_casefold_match(self):
+        self.assertEqual(find_dashboard_uuid("STRASSE", "p"), "u-straße")
+
+    def test_no_match(self):
+        self.assertIsNone(find_dashboard_uuid("marketing", "p"))
+
+    def test_uuid_is_normalized_without_listing(self):
+        self.assertEqual(
+            find_dashboard_uuid("{12345678-1234-5678-1234-56781234ABCD}", "p"),
+            "12345678-1234-5678-1234-56781234abcd",
+        )
+        self.list_dashboards.assert_not_called()
+
+
+class MergeFiltersTest(unittest.TestCase):
+    CHART = {"dimensions": {"id": "root", "and": [{"id": "c1"}, {"id": "c2"}]}, "metrics": {}}
+
+    def test_empty_dashboard_filters_return_chart_filters_unchanged(self):
+        self.assertIs(_merge_filters(self.CHART, {"dimensions": [], "metrics": []}), self.CHART)
+        self.assertIs(_merge_filters(self.CHART, {"dimensions": {"id": "d", "and": []}}), self.CHART)
+
+    def test_and_groups_and_rule_lists_are_spliced_into_one_root(self):
+        merged = _merge_filters(self.CHART, {"dimensions": [{"id": "d1"}], "metrics": []})
+        self.assertEqual(
+            merged["dimensions"],
+            {"id": "merged_root", "and": [{"id": "c1"}, {"id": "c2"}, {"id": "d1"}]},
+        )
+        self.assertEqual(merged["metrics"], {})
+
+    def test_or_groups_and_single_rules_are_kept_whole(self):
+        or_group = {"id": "o", "or": [{"id": "x"}, {"id": "y"}]}
+        rule = {"target": {"fieldId": "t_f"}, "operator": "equals", "values": [1]}
+        merged = _merge_filters({"dimensions": or_group}, {"dimensions": rule})
+        self.assertEqual(merged["dimensions"], {"id": "merged_root", "and": [or_group, rule]})
+
+    def test_missing_chart_filters_take_dashboard_filters(self):
+        dashboard = {"dimensions": [{"id": "d1"}], "metrics": []}
+        self.assertEqual(_merge_filters({}, dashboard), {"dimensions": [{"id": "d1"}], "metrics": []})
+
+    def test_inputs_are_not_mutated(self):
+        chart = {"dimensions": {"id": "root", "and": [{"id": "c1"}]}}
+        _merge_filters(chart, {"dimensions": {"id": "d", "and": [{"id": "d1"}]}})
+        self.assertEqual(chart, {"dimensions": {"id": "root", "and": [{"id": "c1"}]}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+
+from lightdash_mcp import lightdash_client
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"{}", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.text = content.decode()
+
+    def raise_for_status(self):
+        pass
+
+
+class ConditionalGetCacheTest(unittest.TestCase):
+    def setUp(self):
+        lightdash_client._etag_cache.clear()
+        lightdash_client._etag_cache_bytes = 0
+        self.responses = []
+        self.calls = []
+        patcher = mock.patch.object(lightdash_client.session, "request", side_effect=self._request)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs.get("headers")))
+        return self.responses.pop(0)
+
+    def test_304_serves_cached_body(self):
+        self.responses = [
+            FakeResponse(content=b'{"results": 1}', headers={"ETag": '"v1"'}),
+            FakeResponse(status_code=304),
+        ]
+        self.assertEqual(lightdash_client.get("/api/v1/dashboards/d"), {"results": 1})
+        self.assertEqual(lightdash_client.get("/api/v1/dashboards/d"), {"results": 1})
+        self.assertEqual(self.calls[1][2], {"If-None-Match": '"v1"'})
+
+    def test_last_modified_is_sent_as_if_modified_since(self):
+        self.responses = [
+            FakeResponse(headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            FakeResponse(status_code=304),
+        ]
+        lightdash_client.get("/api/v1/projects/p")
+        lightdash_client.get("/api/v1/projects/p")
+        self.assertEqual(self.calls[1][2], {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    def test_query_results_are_not_cached(self):
+        self.responses = [FakeResponse(headers={"ETag": '"q"'}), FakeResponse(headers={"ETag": '"q"'})]
+        lightdash_client.get("/api/v2/projects/p/query/q1")
+        lightdash_client.get("/api/v2/projects/p/query/q1")
+        self.assertEqual(lightdash_client._etag_cache, {})
+        self.assertIsNone(self.calls[1][2])
+
+    def test_write_invalidates_resource_and_children(self):
+        self.responses = [
+            FakeResponse(headers={"ETag": '"a"'}),
+            FakeResponse(headers={"ETag": '"b"'}),
+            FakeResponse(headers={"ETag": '"c"'}),
+            FakeResponse(),
+        ]
+        lightdash_client.get("/api/v1/dashboards/d")
+        lightdash_client.get("/api/v1/dashboards/d/tiles")
+        lightdash_client.get("/api/v1/dashboards/other")
+        lightdash_client.patch("/api/v1/dashboards/d", data={})
+        self.assertEqual(list(lightdash_client._etag_cache), ["/api/v1/dashboards/other"])
+        self.assertEqual(lightdash_client._etag_cache_bytes, 2)
+
+    def test_byte_cap_evicts_least_recently_used(self):
+        body = b'"' + b"x" * 38 + b'"'  # 40 bytes
+        self.responses = [
+            FakeResponse(content=body, headers={"ETag": '"a"'}),
+            FakeResponse(content=body, headers={"ETag": '"b"'}),
+            FakeResponse(status_code=304),
+            FakeResponse(content=body, headers={"ETag": '"c"'}),
+        ]
+        with mock.patch.object(lightdash_client, "_ETAG_CACHE_MAX_BYTES", 100):
+            lightdash_client.get("/a")
+            lightdash_client.get("/b")
+            lightdash_client.get("/a")  # 304 hit makes /a most recently used
+            lightdash_client.get("/c")
+        self.assertEqual(list(lightdash_client._etag_cache), ["/a", "/c"])
+        self.assertEqual(lightdash_client._etag_cache_bytes, 80)
+
+    def test_body_larger_than_cap_is_not_cached(self):
+        self.responses = [FakeResponse(content=b'"' + b"x" * 200 + b'"', headers={"ETag": '"a"'})]
+        with mock.patch.object(lightdash_client, "_ETAG_CACHE_MAX_BYTES", 100):
+            lightdash_client.get("/big")
+        self.assertEqual(lightdash_client._etag_cache, {})
+        self.assertEqual(lightdash_client._etag_cache_bytes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import unittest
+from unittest import mock
+
+from lightdash_mcp.tools import update_dashboard_filters
+
+
+class UpdateDashboardFiltersGuardTest(unittest.TestCase):
+    def setUp(self):
+        # Guards must reject input before any name lookup or API call
+        patcher = mock.patch.object(update_dashboard_filters, "find_dashboard_uuid")
+        self.find_dashboard_uuid = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.find_dashboard_uuid.assert_not_called()
+
+    def test_rejects_oversized_input(self):
+        result = update_dashboard_filters.run("Sales", " " * (update_dashboard_filters._MAX_FILTERS_LENGTH + 1))
+        self.assertIn("too large", result)
+
+    def test_rejects_invalid_json(self):
+        self.assertIn("Error parsing filters JSON", update_dashboard_filters.run("Sales", "{"))
+
+    def test_rejects_non_object(self):
+        self.assertIn("must be a JSON object", update_dashboard_filters.run("Sales", "[]"))
+
+    def test_rejects_deep_nesting(self):
+        filters = {"dimensions": {}}
+        node = filters["dimensions"]
+        for _ in range(update_dashboard_filters._MAX_FILTERS_DEPTH):
+            node["and"] = [{}]
+            node = node["and"][0]
+        self.assertIn("nested more than", update_dashboard_filters.run("Sales", json.dumps(filters)))
+
+    def test_rejects_unknown_operators(self):
+        filters = {"dimensions": [
+            {"operator": "equals"},
+            {"operator": "contains"},
+            {"and": [{"operator": "bogus"}, {"operator": "contains"}]},
+        ]}
+        result = update_dashboard_filters.run("Sales", json.dumps(filters))
+        self.assertIn("unknown filter operator(s) ['contains', 'bogus']", result)
+
+
+class NestingDepthTest(unittest.TestCase):
+    def test_depth_counts_dict_and_list_levels(self):
+        self.assertEqual(update_dashboard_filters._nesting_depth(1), 0)
+        self.assertEqual(update_dashboard_filters._nesting_depth({}), 1)
+        rule_filters = {"dimensions": {"id": "r", "and": [{"target": {"fieldId": "t_f"}, "values": [1]}]}}
+        self.assertEqual(update_dashboard_filters._nesting_depth(rule_filters), 5)
+
+
+class UpdateDashboardFiltersRunTest(unittest.TestCase):
+    def setUp(self):
+        self.dashboard = {"name": "Sales", "tiles": [{"uuid": "t"}], "tabs": [], "filters": {"dimensions": [], "metrics": []}}
+        patches = {
+            "find_dashboard_uuid": mock.patch.object(update_dashboard_filters, "find_dashboard_uuid", return_value="d-uuid"),
+            "get_dashboard_for_update": mock.patch.object(
+                update_dashboard_filters, "get_dashboard_for_update", return_value=self.dashboard
+            ),
+            "patch": mock.patch.object(update_dashboard_filters.lightdash_client, "patch"),
+        }
+        self.mocks = {name: p.start() for name, p in patches.items()}
+        for p in patches.values():
+            self.addCleanup(p.stop)
+
+    def test_unchanged_filters_skip_the_patch(self):
+        result = update_dashboard_filters.run("Sales", '{"metrics": [], "dimensions": []}')
+        self.assertIn("already up to date", result)
+        self.mocks["patch"].assert_not_called()
+
+    def test_changed_filters_send_full_body(self):
+        filters = {"dimensions": [{"id": "f", "target": {"fieldId": "t_f"}, "operator": "equals", "values": [1]}]}
+        update_dashboard_filters.run("Sales", json.dumps(filters))
+        self.mocks["patch"].assert_called_once_with(
+            "/api/v1/dashboards/d-uuid",
+            data={"name": "Sales", "tiles": [{"uuid": "t"}], "filters": filters, "tabs": []},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from lightdash_mcp.tools.utils import format_as_csv
+
+
+class FormatAsCsvTest(unittest.TestCase):
+    def test_uniform_rows(self):
+        rows = [{"a": 1, "b": "x,y"}, {"a": 2, "b": None}]
+        self.assertEqual(format_as_csv(rows), 'a,b\r\n1,"x,y"\r\n2,\r\n')
+
+    def test_single_column(self):
+        self.assertEqual(format_as_csv([{"a": 1}, {"a": 2}]), "a\r\n1\r\n2\r\n")
+
+    def test_ragged_row_missing_key_writes_empty_cell(self):
+        rows = [{"a": 1, "b": 2}, {"a": 3}]
+        self.assertEqual(format_as_csv(rows), "a,b\r\n1,2\r\n3,\r\n")
+
+    def test_ragged_row_extra_key_raises(self):
+        with self.assertRaises(ValueError):
+            format_as_csv([{"a": 1}, {"a": 2, "c": 3}])
+
+    def test_empty_dict_rows(self):
+        self.assertEqual(format_as_csv([{}]), "\r\n\r\n")
+        self.assertEqual(format_as_csv([{}, {}]), "\r\n\r\n\r\n")
+
+    def test_no_rows(self):
+        self.assertEqual(format_as_csv([], {"row_count": 0}), '# Metadata: {"row_count":0}\n# No data rows\n')
+
+
+if __name__ == "__main__":
+    unittest.main()